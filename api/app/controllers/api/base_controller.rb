@@ -85,7 +85,7 @@ module Api
       # New session format: user_id references User record
       if session[:user_id]
         # Validate session age
-        authenticated_at = Time.parse(session[:authenticated_at].to_s) rescue nil
+        authenticated_at = session_authenticated_at
         if authenticated_at.nil? || authenticated_at < SESSION_MAX_AGE.ago
           reset_session
           return @current_user = nil
@@ -103,6 +103,26 @@ module Api
       @current_user = nil
     end
 
+    # Sessions store authenticated_at as ISO 8601 (SessionsController#create),
+    # so it is read back with the strict parser. A missing or malformed value
+    # counts as expired; other errors are not swallowed.
+    def session_authenticated_at
+      Time.iso8601(session[:authenticated_at].to_s)
+    rescue ArgumentError
+      nil
+    end
+
+    # Renders a payload of plain JSON types (Hash, Array, String, Numeric,
+    # true/false/nil) with JSON.generate, skipping ActiveSupport's recursive
+    # as_json conversion. Strings are treated as already-encoded JSON.
+    #
+    # Do not pass Active Record objects or Time values: they rely on as_json
+    # for their API representation. Use plain `render json:` for those.
+    def render_json(payload, status: :ok)
+      body = payload.is_a?(String) ? payload : JSON.generate(payload)
+      render json: body, status: status
+    end
+
     def require_owner!
       head :forbidden unless current_user&.owner?
     end
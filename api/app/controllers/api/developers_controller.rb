@@ -22,7 +22,7 @@ module Api
                           .uniq
                           .sort
 
-      render json: { developers: developers }
+      render_json({ developers: developers })
     end
 
     # GET /api/developers/managed
@@ -81,7 +81,7 @@ module Api
       found_in_any = sprints.any? { |s| s.find_developer(developer_name) }
       raise ActiveRecord::RecordNotFound, "Developer '#{developer_name}' not found" unless found_in_any
 
-      render json: DeveloperHistorySerializer.new(developer_name, sprints).as_json
+      render_json(DeveloperHistorySerializer.new(developer_name, sprints).as_json)
     end
 
     private
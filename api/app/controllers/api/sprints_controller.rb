@@ -2,23 +2,31 @@
 
 module Api
   class SprintsController < BaseController
+    # Query string values that request a force refresh
+    FORCE_REFRESH_VALUES = %w[true 1].freeze
+
     # Stricter rate limit for force_refresh which triggers expensive GitHub API calls
     # Disabled in development for easier testing
     rate_limit to: 5, within: 1.hour, by: -> { request.remote_ip },
                only: :metrics,
-               if: -> { params[:force_refresh] == "true" && !Rails.env.development? },
+               if: -> { force_refresh? && !Rails.env.development? },
                with: -> { force_refresh_rate_limited }
 
     # GET /api/sprints
     #
     # Returns list of available sprints for the dropdown selector.
     # Matches FastAPI's SprintListResponse format.
+    #
+    # The encoded body is cached per day and per newest sprint row, so a day
+    # rollover or a newly stored sprint rebuilds it at once (with a TTL as a
+    # safety net).
     def index
-      sprints = Sprint.available_sprints
+      key = [ "sprint_list", Date.current, Sprint.maximum(:updated_at)&.to_fs(:usec) ]
+      body = Rails.cache.fetch(key, expires_in: 5.minutes) do
+        JSON.generate(sprints: Sprint.available_sprints.map { |s| serialize_sprint_item(s) })
+      end
 
-      render json: {
-        sprints: sprints.map { |s| serialize_sprint_item(s) }
-      }
+      render_json(body)
     end
 
     # GET /api/sprints/:start_date/:end_date/metrics
@@ -35,9 +43,10 @@ module Api
     def metrics
       start_date = Date.parse(params[:start_date])
       end_date = Date.parse(params[:end_date])
-      force_refresh = params[:force_refresh] == "true"
+      force_refresh = force_refresh?
 
       sprint = Sprint.find_or_fetch!(start_date, end_date, force: force_refresh)
+      refresh_in_background(sprint) if !force_refresh && sprint.stale?
       filters = resolve_filters
 
       # Set cache headers for browser/CDN
@@ -46,7 +55,7 @@ module Api
 
       # If force_refresh, always return full response (bypass ETag check)
       if force_refresh
-        return render json: MetricsResponseSerializer.new(sprint, **filters).as_json
+        return render_json(MetricsResponseSerializer.new(sprint, **filters).as_json)
       end
 
       # Generate ETag based on content hash + filter params
@@ -58,9 +67,16 @@ module Api
         return head :not_modified
       end
 
-      # Return full response with ETag header
+      # Return full response with ETag header. The encoded body is cached per
+      # ETag (plus team name, which is display-only and not part of the ETag),
+      # so repeat requests skip serialization entirely. A refresh that changes
+      # the data bumps updated_at, which changes the ETag and so the key; one
+      # that fetches identical data leaves both, and the cached body, valid.
       response.set_header("ETag", "\"#{etag}\"")
-      render json: MetricsResponseSerializer.new(sprint, **filters).as_json
+      body = Rails.cache.fetch([ "sprint_metrics", etag, filters[:team_name] ]) do
+        JSON.generate(MetricsResponseSerializer.new(sprint, **filters).as_json)
+      end
+      render_json(body)
     end
 
     # GET /api/sprints/history
@@ -75,22 +91,40 @@ module Api
       sprints = Sprint.order(start_date: :desc).limit(count).reverse
       filters = resolve_filters.except(:team_name)
 
-      render json: {
-        sprints: sprints.map { |s| SprintHistorySerializer.new(s, **filters).as_json }
-      }
+      render_json({
+        sprints: SprintHistorySerializer.collection(sprints, **filters)
+      })
     end
 
     private
 
+    # Reads force_refresh straight from the query string (memoized), so the
+    # rate limit check and the action share one parse and skip building the
+    # merged params hash.
+    def force_refresh?
+      return @force_refresh if defined?(@force_refresh)
+
+      @force_refresh = FORCE_REFRESH_VALUES.include?(request.query_parameters["force_refresh"])
+    end
+
+    # Stale current-sprint data is returned immediately and refreshed by the
+    # background job instead of making this request wait on GitHub. The cache
+    # entry stops a burst of requests from each enqueueing a refresh.
+    def refresh_in_background(sprint)
+      return unless Rails.cache.write([ "sprint_refresh_enqueued", sprint.id ], true, unless_exist: true, expires_in: 15.minutes)
+
+      RefreshGithubDataJob.perform_later
+    end
+
     # Resolves visibility and team filter params into serializer kwargs.
     # Returns empty hash when no filters are active (backwards compatible).
     def resolve_filters
       filters = {}
 
-      # Always apply visibility filtering when Developer records exist
-      if Developer.exists?
-        filters[:visible_logins] = Developer.visible_logins
-      end
+      # Apply visibility filtering when Developer records exist. One pluck
+      # covers both checks: with no visible rows there is nothing to filter by.
+      visible_logins = Developer.visible_logins
+      filters[:visible_logins] = visible_logins if visible_logins.any?
 
       # Apply team filter if ?team=slug is present
       if params[:team].present?
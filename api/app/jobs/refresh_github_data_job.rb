@@ -1,6 +1,10 @@
 # frozen_string_literal: true
 
 # Hourly job to refresh GitHub metrics for current and previous sprint.
+#
+# A previous sprint whose stored data has settled (see Sprint#settled?) is
+# left alone; refetching it would only spend GitHub rate limit. A manual
+# force_refresh still refetches it.
 class RefreshGithubDataJob < ApplicationJob
   queue_as :default
   limits_concurrency to: 1, key: -> { "github_refresh" }
@@ -8,9 +12,24 @@ class RefreshGithubDataJob < ApplicationJob
   def perform
     Rails.logger.info "[RefreshGithubDataJob] Starting hourly refresh"
 
-    results = Sprint.available_sprints(limit: 2).map do |sprint_info|
-      refresh_sprint(sprint_info)
+    # The sprints are independent, so their GitHub fetches run side by side
+    # and the job takes about as long as the slowest one. Each thread runs
+    # inside the executor and holds its own connection only for its refresh;
+    # with Solid Queue's three worker threads that is 5, the default pool.
+    threads = Sprint.available_sprints(limit: 2).map do |sprint_info|
+      Thread.new do
+        Rails.application.executor.wrap do
+          ActiveRecord::Base.connection_pool.with_connection { refresh_sprint(sprint_info) }
+        end
+      rescue StandardError => e
+        e
+      end
     end
+    # Wait for every sprint before raising, so an unexpected error in one
+    # never abandons the other mid-refresh.
+    results = ActiveSupport::Dependencies.interlock.permit_concurrent_loads { threads.map(&:value) }
+    error = results.find { |result| result.is_a?(StandardError) }
+    raise error if error
 
     succeeded = results.count(:success)
     failed = results.count(:failed)
@@ -37,6 +56,11 @@ class RefreshGithubDataJob < ApplicationJob
     start_date = sprint_info[:start_date]
     end_date = sprint_info[:end_date]
 
+    if Sprint.find_by_dates(start_date, end_date)&.settled?
+      Rails.logger.info "[RefreshGithubDataJob] Sprint #{start_date} has settled, skipping"
+      return :success
+    end
+
     Rails.logger.info "[RefreshGithubDataJob] Refreshing #{start_date} to #{end_date}"
     SprintLoader.new.load(start_date, end_date, force: true)
     :success
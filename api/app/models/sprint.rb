@@ -8,6 +8,22 @@ require "digest"
 # This matches the access pattern (always load full sprint) and simplifies
 # the codebase vs. normalized tables.
 class Sprint < ApplicationRecord
+  # How long after a sprint ends its GitHub data keeps changing. PRs, reviews
+  # and merges are counted only up to end_date, but commits authored in the
+  # window can still reach the default branch for a few days after it.
+  SETTLE_PERIOD = 3.days
+
+  # Current-sprint data older than this is served as-is while a background
+  # refresh runs. The hourly RefreshGithubDataJob normally keeps it fresher.
+  STALE_AFTER = 2.hours
+
+  # "Jan 07 - Jan 20" labels keyed by [start_date, end_date]. History endpoints
+  # label the same handful of sprints on every request.
+  RANGE_LABELS = Concurrent::Map.new
+  RANGE_LABELS_MAX = 256
+
+  attribute :data, JsonBlobType.new
+
   validates :start_date, :end_date, presence: true
   validates :start_date, uniqueness: { scope: :end_date }
   validate :end_date_after_start_date
@@ -35,6 +51,25 @@ class Sprint < ApplicationRecord
       SprintLoader.new.load(start_date, end_date, force: force)
     end
 
+    # Sprint data with every developer's scores and the team aggregates
+    # recomputed from the raw metrics, ready to store. Lets imports score rows
+    # before their single write instead of saving and then recalculating.
+    #
+    # @param data [Hash] sprint data with a "developers" array
+    # @return [Hash] a copy of data with scores, team_dimension_scores and summary
+    def with_scores(data)
+      developers = (data["developers"] || []).map do |dev|
+        scores, composite = DxiCalculator.developer_scores(dev)
+        dev.merge("dxi_score" => composite, "dimension_scores" => scores)
+      end
+
+      data.merge(
+        "developers" => developers,
+        "team_dimension_scores" => DxiCalculator.team_dimension_scores(developers).transform_keys(&:to_s),
+        "summary" => DxiCalculator.team_summary(developers)
+      )
+    end
+
     # Calculate current sprint dates based on configuration
     def current_sprint_dates
       config = Rails.application.config.opendxi
@@ -50,6 +85,13 @@ class Sprint < ApplicationRecord
       [ sprint_start, sprint_end ]
     end
 
+    def range_label(start_date, end_date)
+      RANGE_LABELS.clear if RANGE_LABELS.size >= RANGE_LABELS_MAX
+      RANGE_LABELS.compute_if_absent([ start_date, end_date ]) do
+        "#{start_date.strftime('%b %d')} - #{end_date.strftime('%b %d')}".freeze
+      end
+    end
+
     # Get list of available sprints for dropdown selector
     def available_sprints(limit: 6)
       config = Rails.application.config.opendxi
@@ -66,7 +108,7 @@ class Sprint < ApplicationRecord
         sprint_end = sprint_start + (duration - 1).days
 
         {
-          label: i.zero? ? "Current Sprint" : "#{sprint_start.strftime('%b %d')} - #{sprint_end.strftime('%b %d')}",
+          label: i.zero? ? "Current Sprint" : range_label(sprint_start, sprint_end),
           value: "#{sprint_start}|#{sprint_end}",
           start_date: sprint_start,
           end_date: sprint_end,
@@ -80,20 +122,26 @@ class Sprint < ApplicationRecord
   # JSON Data Accessors
   # ═══════════════════════════════════════════════════════════════════════════
 
+  # Defaults for rows without data are shared frozen instances, so reading
+  # an empty sprint allocates nothing.
+  EMPTY_LIST = [].freeze
+  EMPTY_HASH = {}.freeze
+  private_constant :EMPTY_LIST, :EMPTY_HASH
+
   def developers
-    data&.dig("developers") || []
+    data&.dig("developers") || EMPTY_LIST
   end
 
   def daily_activity
-    data&.dig("daily_activity") || []
+    data&.dig("daily_activity") || EMPTY_LIST
   end
 
   def summary
-    data&.dig("summary") || {}
+    data&.dig("summary") || EMPTY_HASH
   end
 
   def team_dimension_scores
-    data&.dig("team_dimension_scores") || {}
+    data&.dig("team_dimension_scores") || EMPTY_HASH
   end
 
   # ═══════════════════════════════════════════════════════════════════════════
@@ -105,7 +153,20 @@ class Sprint < ApplicationRecord
   end
 
   def label
-    current? ? "Current Sprint" : "#{start_date.strftime('%b %d')} - #{end_date.strftime('%b %d')}"
+    current? ? "Current Sprint" : self.class.range_label(start_date, end_date)
+  end
+
+  # True once the stored data was fetched after SETTLE_PERIOD had passed
+  # since the sprint ended, so a scheduled refetch would not change it.
+  # Based on fetched_at: a refetch of identical data leaves updated_at alone.
+  def settled?
+    fetched_at.present? && fetched_at >= end_date.end_of_day + SETTLE_PERIOD
+  end
+
+  # Like settled?, based on fetched_at: in quiet periods the hourly refresh
+  # stores identical data and updated_at stops moving.
+  def stale?
+    current? && fetched_at.present? && fetched_at < STALE_AFTER.ago
   end
 
   def date_range_param
@@ -115,7 +176,7 @@ class Sprint < ApplicationRecord
   # Generate content-based ETag for HTTP caching
   #
   # Creates a unique cache key based on:
-  # - Actual data content (SHA256 hash of sorted data)
+  # - Actual data content (SHA256 hash of the stored JSON text)
   # - Updated timestamp
   #
   # This ensures ETags change if:
@@ -124,45 +185,93 @@ class Sprint < ApplicationRecord
   #
   # Uses SHA256 (not MD5) for cryptographic strength against collision attacks.
   #
+  # The digest is taken over the column's raw JSON text, so building the ETag
+  # never parses the data blob. Hashing still walks every byte, so the result
+  # is cached across requests keyed on id + microsecond updated_at. A save
+  # that changes data bumps updated_at and moves the lookup to a fresh key;
+  # a refetch that stores identical data writes nothing, keeps updated_at,
+  # and correctly keeps the same ETag.
+  #
   # ETag format: "#{id}-#{data_hash}-#{updated_timestamp}"
   # Example: "123-abc123def456...xyz-1672531200"
   def generate_cache_key
     return unless id
-    if data.present?
-      data_hash = Digest::SHA256.hexdigest(JSON.generate(data.to_h.sort.to_s))
-      "#{id}-#{data_hash}-#{updated_at.to_i}"
+
+    Rails.cache.fetch([ "sprint_etag", id, updated_at&.to_fs(:usec) ]) do
+      raw = raw_data_json
+      if raw.present? && raw != "{}"
+        data_hash = Digest::SHA256.hexdigest(raw)
+        "#{id}-#{data_hash}-#{updated_at.to_i}"
+      else
+        "#{id}-empty-#{updated_at.to_i}"
+      end
+    end
+  end
+
+  # Stores data just fetched from GitHub and records the fetch time.
+  #
+  # A refetch that returns the stored data unchanged only writes fetched_at,
+  # with update_columns, so updated_at and the ETag derived from it stay as
+  # they are. Changed data (or a new row) is saved normally.
+  #
+  # @param data [Hash] sprint data from the fetcher
+  # @param fetched_at [Time] when the fetch ran
+  # @return [Sprint] self
+  def store_fetched_data!(data, fetched_at: Time.current)
+    self.data = data
+
+    if new_record? || changed?
+      self.fetched_at = fetched_at
+      save!
     else
-      "#{id}-empty-#{updated_at.to_i}"
+      update_columns(fetched_at: fetched_at)
     end
+
+    self
   end
 
   # Find a specific developer by login
+  #
+  # Uses a login index built once per loaded data hash, so the developer
+  # history endpoint (which looks the same developer up in each sprint twice)
+  # does hash lookups instead of rescanning every developer list.
   def find_developer(login)
-    developers.find { |d| d["developer"] == login || d["github_login"] == login }
+    developers_by_login[login]
   end
 
   # Recalculate DXI scores (useful after algorithm changes)
   def recalculate_scores!
     return unless data.present?
 
-    developers_with_scores = developers.map do |dev|
-      scores = DxiCalculator.dimension_scores(dev)
-      dev.merge(
-        "dxi_score" => DxiCalculator.composite_score(scores),
-        "dimension_scores" => scores.transform_keys(&:to_s)
-      )
-    end
-
-    self.data = data.merge(
-      "developers" => developers_with_scores,
-      "team_dimension_scores" => DxiCalculator.team_dimension_scores(developers_with_scores).transform_keys(&:to_s),
-      "summary" => build_summary(developers_with_scores)
-    )
+    self.data = self.class.with_scores(data)
     save!
   end
 
   private
 
+  # Maps both "developer" and "github_login" to the developer hash; the first
+  # developer carrying a login wins, as with a linear scan. Rebuilt whenever
+  # data is reassigned.
+  def developers_by_login
+    return @developers_by_login if @developers_by_login_source.equal?(data)
+
+    @developers_by_login_source = data
+    @developers_by_login = developers.each_with_object({}) do |dev, index|
+      index[dev["developer"]] ||= dev if dev["developer"]
+      index[dev["github_login"]] ||= dev if dev["github_login"]
+    end
+  end
+
+  # The data column as stored JSON text. Persisted records hold the database
+  # string; a freshly assigned Hash is encoded with the column's own type so
+  # both paths hash identical bytes.
+  def raw_data_json
+    raw = data_before_type_cast
+    return raw if raw.nil? || raw.is_a?(String)
+
+    self.class.type_for_attribute(:data).serialize(raw)
+  end
+
   def end_date_after_start_date
     return unless start_date && end_date
     errors.add(:end_date, "must be after start date") if end_date < start_date
@@ -195,15 +304,4 @@ class Sprint < ApplicationRecord
     return if value.nil?
     errors.add(:data, "#{key} must be a hash") unless value.is_a?(Hash)
   end
-
-  def build_summary(devs)
-    {
-      "total_commits" => devs.sum { |d| d["commits"] || 0 },
-      "total_prs" => devs.sum { |d| d["prs_opened"] || 0 },
-      "total_merged" => devs.sum { |d| d["prs_merged"] || 0 },
-      "total_reviews" => devs.sum { |d| d["reviews_given"] || 0 },
-      "developer_count" => devs.size,
-      "avg_dxi_score" => devs.any? ? (devs.sum { |d| d["dxi_score"] || 0 } / devs.size.to_f).round(1) : 0
-    }
-  end
 end
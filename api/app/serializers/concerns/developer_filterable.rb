@@ -12,6 +12,9 @@
 #   - filtering?           whether any filter is active
 #   - filtered_developers  the developer list after applying active filters
 #   - developer_login(dev) canonical login extraction from a developer hash
+#   - login_set(logins)    normalizes a login filter to a Set (or nil when blank)
+#   - stored_aggregates_apply?(devs) whether the sprint's stored aggregates
+#                          still describe the filtered developers
 module DeveloperFilterable
   def filtering?
     @visible_logins.present? || @team_logins.present?
@@ -27,4 +30,19 @@ module DeveloperFilterable
   def developer_login(dev)
     dev["github_login"] || dev["developer"]
   end
+
+  # Stored aggregates are trusted when the filter removed nobody and the
+  # sprint actually has them (legacy rows may carry an empty summary).
+  def stored_aggregates_apply?(devs)
+    devs.size == @sprint.developers.size &&
+      @sprint.summary.present? &&
+      @sprint.team_dimension_scores.present?
+  end
+
+  # Accepts an already-built Set so collection serializers can share one
+  # instance across many sprints instead of rebuilding it per sprint.
+  def login_set(logins)
+    return nil if logins.blank?
+    logins.is_a?(Set) ? logins : Set.new(logins)
+  end
 end
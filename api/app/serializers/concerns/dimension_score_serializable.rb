@@ -10,15 +10,20 @@
 #   - String/symbol key indifference (from JSON vs. Ruby hash sources)
 #   - Default values for missing scores
 module DimensionScoreSerializable
+  # API field name => stored field name
+  DIMENSION_FIELDS = {
+    review_speed: "review_turnaround",
+    cycle_time: "cycle_time",
+    pr_size: "pr_size",
+    review_coverage: "review_coverage",
+    commit_frequency: "commit_frequency"
+  }.freeze
+
   def serialize_dimension_scores(scores)
     return nil unless scores
 
-    {
-      review_speed: scores["review_turnaround"] || scores[:review_turnaround] || 0.0,
-      cycle_time: scores["cycle_time"] || scores[:cycle_time] || 0.0,
-      pr_size: scores["pr_size"] || scores[:pr_size] || 0.0,
-      review_coverage: scores["review_coverage"] || scores[:review_coverage] || 0.0,
-      commit_frequency: scores["commit_frequency"] || scores[:commit_frequency] || 0.0
-    }
+    # Stored JSON always has string keys; only recomputed scores use symbols
+    scores = scores.stringify_keys if scores.each_key.first.is_a?(Symbol)
+    DIMENSION_FIELDS.transform_values { |key| scores[key] || 0.0 }
   end
 end
@@ -47,6 +47,6 @@ class DeveloperHistorySerializer
   end
 
   def team_sprint_entries
-    @sprints.map { |sprint| SprintHistorySerializer.new(sprint).as_json }
+    SprintHistorySerializer.collection(@sprints)
   end
 end
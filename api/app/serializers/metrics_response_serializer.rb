@@ -4,7 +4,8 @@
 #
 # Supports optional filtering by visible developers and/or team membership.
 # When filters are applied, summary stats and team dimension scores are
-# recomputed from the filtered developer set.
+# recomputed from the filtered developer set. Filters that keep every
+# developer reuse the stored aggregates, which were computed at write time.
 #
 # Key transformations:
 #   - `daily_activity` -> `daily` (field rename)
@@ -15,25 +16,26 @@ class MetricsResponseSerializer
   include DeveloperFilterable
 
   # @param sprint [Sprint] the sprint to serialize
-  # @param visible_logins [Array<String>, nil] if set, only include these logins
-  # @param team_logins [Array<String>, nil] if set, only include these logins
+  # @param visible_logins [Array<String>, Set, nil] if set, only include these logins
+  # @param team_logins [Array<String>, Set, nil] if set, only include these logins
   # @param team_name [String, nil] team name for filter_meta display
   def initialize(sprint, visible_logins: nil, team_logins: nil, team_name: nil)
     @sprint = sprint
-    @visible_logins = visible_logins.present? ? Set.new(visible_logins) : nil
-    @team_logins = team_logins.present? ? Set.new(team_logins) : nil
+    @visible_logins = login_set(visible_logins)
+    @team_logins = login_set(team_logins)
     @team_name = team_name
   end
 
   def as_json
     devs = filtered_developers
     filtered = filtering?
+    recompute = filtered && !stored_aggregates_apply?(devs)
 
     result = {
       developers: devs.map { |d| serialize_developer(d) },
       daily: @sprint.daily_activity,
-      summary: filtered ? recompute_summary(devs) : serialize_summary(@sprint.summary),
-      team_dimension_scores: filtered ? recompute_dimension_scores(devs) : serialize_dimension_scores(@sprint.team_dimension_scores)
+      summary: serialize_summary(recompute ? DxiCalculator.team_summary(devs) : @sprint.summary),
+      team_dimension_scores: recompute ? recompute_dimension_scores(devs) : serialize_dimension_scores(@sprint.team_dimension_scores)
     }
 
     result[:filter_meta] = build_filter_meta(devs) if filtered
@@ -68,16 +70,6 @@ class MetricsResponseSerializer
     }
   end
 
-  def recompute_summary(devs)
-    {
-      total_commits: devs.sum { |d| d["commits"] || 0 },
-      total_prs: devs.sum { |d| d["prs_opened"] || 0 },
-      total_merged: devs.sum { |d| d["prs_merged"] || 0 },
-      total_reviews: devs.sum { |d| d["reviews_given"] || 0 },
-      avg_dxi_score: devs.any? ? (devs.sum { |d| d["dxi_score"] || 0 } / devs.size.to_f).round(1) : 0.0
-    }
-  end
-
   def recompute_dimension_scores(devs)
     serialize_dimension_scores(DxiCalculator.team_dimension_scores(devs))
   end
@@ -1,9 +1,12 @@
 # frozen_string_literal: true
 
+require "digest"
+
 # Serializes Sprint data for historical trend analysis.
 #
 # Supports optional filtering by visible developers and/or team membership.
-# When filters are applied, aggregates are recomputed from the filtered set.
+# When filters remove developers, aggregates are recomputed from the filtered
+# set; otherwise the stored aggregates are used as-is.
 #
 # Used by:
 #   - GET /api/sprints/history (team trends)
@@ -12,27 +15,60 @@ class SprintHistorySerializer
   include DimensionScoreSerializable
   include DeveloperFilterable
 
+  # Serializes several sprints with the same filters, building the login
+  # sets once for the whole batch.
+  #
+  # Entries are cached per sprint row version and filter, since both history
+  # endpoints rebuild the same entries for past sprints on every request. A
+  # refresh that changes the data bumps updated_at, which moves the sprint to
+  # a new key. The label depends on today's date ("Current Sprint" until the
+  # sprint ends), so it is applied after the cache read instead of stored.
+  #
+  # @param sprints [Array<Sprint>] sprints to serialize, in display order
+  # @return [Array<Hash>] one history entry per sprint
+  def self.collection(sprints, visible_logins: nil, team_logins: nil)
+    visible = Set.new(visible_logins) if visible_logins.present?
+    team = Set.new(team_logins) if team_logins.present?
+    filter_key = filter_cache_key(visible, team)
+
+    sprints.map do |sprint|
+      entry = Rails.cache.fetch([ "sprint_history_entry", sprint.id, sprint.updated_at&.to_fs(:usec), filter_key ], expires_in: 1.hour) do
+        new(sprint, visible_logins: visible, team_logins: team).as_json.except(:sprint_label)
+      end
+      { sprint_label: sprint.label }.merge(entry)
+    end
+  end
+
+  def self.filter_cache_key(visible, team)
+    return "all" unless visible || team
+
+    Digest::SHA256.hexdigest([ visible&.sort, team&.sort ].to_json)[0..15]
+  end
+  private_class_method :filter_cache_key
+
   # @param sprint [Sprint] the sprint to serialize
-  # @param visible_logins [Array<String>, nil] if set, only include these logins
-  # @param team_logins [Array<String>, nil] if set, only include these logins
+  # @param visible_logins [Array<String>, Set, nil] if set, only include these logins
+  # @param team_logins [Array<String>, Set, nil] if set, only include these logins
   def initialize(sprint, visible_logins: nil, team_logins: nil)
     @sprint = sprint
-    @visible_logins = visible_logins.present? ? Set.new(visible_logins) : nil
-    @team_logins = team_logins.present? ? Set.new(team_logins) : nil
+    @visible_logins = login_set(visible_logins)
+    @team_logins = login_set(team_logins)
   end
 
   def as_json
-    if filtering?
-      devs = filtered_developers
+    devs = filtered_developers if filtering?
+
+    if devs && !stored_aggregates_apply?(devs)
+      summary = DxiCalculator.team_summary(devs)
       {
         sprint_label: @sprint.label,
         start_date: @sprint.start_date.to_s,
         end_date: @sprint.end_date.to_s,
-        avg_dxi_score: devs.any? ? (devs.sum { |d| d["dxi_score"] || 0 } / devs.size.to_f).round(1) : 0.0,
+        avg_dxi_score: summary["avg_dxi_score"],
         dimension_scores: serialize_dimension_scores(DxiCalculator.team_dimension_scores(devs)),
         developer_count: devs.size,
-        total_commits: devs.sum { |d| d["commits"] || 0 },
-        total_prs: devs.sum { |d| d["prs_opened"] || 0 }
+        total_commits: summary["total_commits"],
+        total_prs: summary["total_prs"]
       }
     else
       summary = @sprint.summary
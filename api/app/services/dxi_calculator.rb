@@ -19,6 +19,11 @@ class DxiCalculator
     commit_frequency: 0.15
   }.freeze
 
+  DIMENSIONS = WEIGHTS.keys.freeze
+
+  # Stored (JSON) key for each dimension, precomputed to avoid Symbol#to_s in loops
+  DIMENSION_KEYS = DIMENSIONS.index_with { |dim| dim.name }.freeze
+
   THRESHOLDS = {
     review_time: { min: 2, max: 24 },    # hours
     cycle_time: { min: 8, max: 72 },     # hours
@@ -27,6 +32,18 @@ class DxiCalculator
     commits: { target: 20 }               # count
   }.freeze
 
+  # Inverse-scale parameters derived once from THRESHOLDS: the full-score
+  # bound and the points lost per unit above it. Scoring a developer then
+  # needs no nested hash lookups or division.
+  INVERSE_SCALES = THRESHOLDS.slice(:review_time, :cycle_time, :pr_size).transform_values do |t|
+    [ t[:min], 100.0 / (t[:max] - t[:min]) ].freeze
+  end.freeze
+
+  # Team scores for a sprint without developers: neutral on every dimension.
+  # Shared and frozen, since every caller copies it (transform_keys,
+  # serialization) rather than modifying it.
+  EMPTY_TEAM_SCORES = DIMENSIONS.index_with { 50.0 }.freeze
+
   class << self
     # Calculate composite DXI score from dimension scores
     # @param dimension_scores [Hash] scores for each dimension (0-100)
@@ -39,7 +56,9 @@ class DxiCalculator
     # @param metrics [Hash] developer activity metrics
     # @return [Hash] scores for each dimension (0-100)
     def dimension_scores(metrics)
-      metrics = metrics.with_indifferent_access if metrics.respond_to?(:with_indifferent_access)
+      # Stored and fetched metrics are string-keyed; only convert symbol-keyed
+      # input rather than copying every hash into an indifferent-access one.
+      metrics = metrics.stringify_keys if metrics.first&.first.is_a?(Symbol)
 
       {
         review_turnaround: review_turnaround_score(metrics["avg_review_time_hours"]),
@@ -50,51 +69,93 @@ class DxiCalculator
       }
     end
 
+    # Calculate a developer's dimension scores and composite DXI score together
+    # @param metrics [Hash] developer activity metrics
+    # @return [Array(Hash, Float)] dimension scores keyed by their stored
+    #   (string) names, and the weighted composite score
+    def developer_scores(metrics)
+      scores = dimension_scores(metrics)
+      [ scores.transform_keys(DIMENSION_KEYS), composite_score(scores) ]
+    end
+
     # Calculate team-level dimension scores (average of all developers)
+    #
+    # Accumulates every dimension in a single pass over the developer list
+    # rather than one pass (and one intermediate array) per dimension.
+    #
     # @param developers [Array<Hash>] list of developer metrics with dimension_scores
     # @return [Hash] average scores for each dimension
     def team_dimension_scores(developers)
-      return empty_team_scores if developers.empty?
+      return EMPTY_TEAM_SCORES if developers.empty?
 
-      dimensions = %i[review_turnaround cycle_time pr_size review_coverage commit_frequency]
-      dimensions.index_with do |dim|
-        scores = developers.map { |d| d.dig("dimension_scores", dim.to_s) || d.dig(:dimension_scores, dim) || 0 }
-        (scores.sum / scores.size.to_f).round(1)
+      totals = Array.new(DIMENSIONS.size, 0)
+      developers.each do |d|
+        scores = d["dimension_scores"] || d[:dimension_scores]
+        next unless scores
+
+        DIMENSION_KEYS.each_with_index do |(dim, key), i|
+          totals[i] += scores[key] || scores[dim] || 0
+        end
       end
+
+      count = developers.size.to_f
+      DIMENSIONS.each_with_index.to_h { |dim, i| [ dim, (totals[i] / count).round(1) ] }
     end
 
-    private
+    # Calculate team-level activity totals and average DXI score
+    #
+    # Single source for the stored sprint "summary" block; the GitHub fetch,
+    # score recalculation and filtered API responses all build it here.
+    #
+    # Totals are accumulated in one pass over the developer list.
+    #
+    # @param developers [Array<Hash>] list of developer metrics with dxi_score
+    # @return [Hash] summary with string keys, matching the stored JSON
+    def team_summary(developers)
+      commits = prs = merged = reviews = dxi_total = 0
+      developers.each do |d|
+        commits += d["commits"] || 0
+        prs += d["prs_opened"] || 0
+        merged += d["prs_merged"] || 0
+        reviews += d["reviews_given"] || 0
+        dxi_total += d["dxi_score"] || 0
+      end
 
-    def empty_team_scores
       {
-        review_turnaround: 50.0,
-        cycle_time: 50.0,
-        pr_size: 50.0,
-        review_coverage: 50.0,
-        commit_frequency: 50.0
+        "total_commits" => commits,
+        "total_prs" => prs,
+        "total_merged" => merged,
+        "total_reviews" => reviews,
+        "developer_count" => developers.size,
+        "avg_dxi_score" => developers.any? ? (dxi_total / developers.size.to_f).round(1) : 0.0
       }
     end
 
+    private
+
     # Review turnaround: <2h = 100, >24h = 0
     def review_turnaround_score(hours)
-      return 100.0 if hours.nil? || hours <= THRESHOLDS[:review_time][:min]
-      normalize_inverse(hours, THRESHOLDS[:review_time][:min], THRESHOLDS[:review_time][:max])
+      min, slope = INVERSE_SCALES[:review_time]
+      return 100.0 if hours.nil? || hours <= min
+      normalize_inverse(hours, min, slope)
     end
 
     # Cycle time: <8h = 100, >72h = 0
     def cycle_time_score(hours)
-      return 100.0 if hours.nil? || hours <= THRESHOLDS[:cycle_time][:min]
-      normalize_inverse(hours, THRESHOLDS[:cycle_time][:min], THRESHOLDS[:cycle_time][:max])
+      min, slope = INVERSE_SCALES[:cycle_time]
+      return 100.0 if hours.nil? || hours <= min
+      normalize_inverse(hours, min, slope)
     end
 
     # PR size: <200 lines = 100, >1000 lines = 0
     def pr_size_score(lines_added, lines_deleted, prs_opened)
       return 100.0 if prs_opened.nil? || prs_opened.zero?
 
+      min, slope = INVERSE_SCALES[:pr_size]
       avg_size = ((lines_added || 0) + (lines_deleted || 0)) / prs_opened.to_f
-      return 100.0 if avg_size <= THRESHOLDS[:pr_size][:min]
+      return 100.0 if avg_size <= min
 
-      normalize_inverse(avg_size, THRESHOLDS[:pr_size][:min], THRESHOLDS[:pr_size][:max])
+      normalize_inverse(avg_size, min, slope)
     end
 
     # Review coverage: 10+ reviews = 100, linear scale below
@@ -110,9 +171,10 @@ class DxiCalculator
     end
 
     # Inverse normalization: lower values = higher scores
-    # Formula: 100 - ((value - min) / (max - min)) * 100
-    def normalize_inverse(value, min, max)
-      score = 100.0 - ((value - min) * (100.0 / (max - min)))
+    # Formula: 100 - ((value - min) / (max - min)) * 100, with the
+    # 100 / (max - min) slope taken from INVERSE_SCALES
+    def normalize_inverse(value, min, slope)
+      score = 100.0 - ((value - min) * slope)
       [ [ 0.0, score ].max, 100.0 ].min.round(1)
     end
   end
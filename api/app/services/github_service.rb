@@ -17,6 +17,30 @@ class GithubService
   GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
   GITHUB_REST_URL = "https://api.github.com"
 
+  # The org's repository list changes rarely but is needed by every sprint
+  # fetch, so it is cached per org and sprint start. This is only a TTL cache
+  # (with jitter, so copies for several sprints don't all expire together):
+  # the first caller after expiry pages the full list itself, and
+  # race_condition_ttl lets concurrent callers keep reading the old list for
+  # those 30 seconds instead of all refetching it.
+  #
+  # A forced fetch skips the cached list and writes the fresh one back, so a
+  # force_refresh always sees newly pushed repos.
+  REPOS_CACHE_TTL = 15.minutes
+  REPOS_CACHE_JITTER = 0.1
+
+  # Per-developer and per-day counters built while aggregating a sprint.
+  # Structs give fixed accessors instead of a string-keyed Hash per entry.
+  DeveloperStats = Struct.new(
+    :commits, :prs_opened, :prs_merged, :reviews_given,
+    :lines_added, :lines_deleted, :review_times, :cycle_times
+  )
+  DailyStats = Struct.new(:commits, :prs_opened, :prs_merged, :reviews_given)
+  private_constant :DeveloperStats, :DailyStats
+
+  # Suffix GitHub appends to app/bot account logins, which are excluded
+  BOT_SUFFIX = "[bot]"
+
   REPOS_QUERY = <<~GRAPHQL
     query($org: String!, $cursor: String) {
       organization(login: $org) {
@@ -28,54 +52,71 @@ class GithubService
     }
   GRAPHQL
 
-  # PRs query with inline reviews (first 20) to eliminate O(PRs) separate API calls.
+  # Maximum number of repos aliased into a single GraphQL document. Larger
+  # batches risk GitHub's request timeout on repos with many PRs.
+  REPO_BATCH_SIZE = 10
+
+  # Per-repo connections are requested for many repos at once: each repo
+  # becomes an aliased `repository` field (r0, r1, ...) in one document, so a
+  # batch costs one round trip instead of one per repo. %<cursor>s is replaced
+  # with the alias's own cursor variable.
+
+  # PRs connection with inline reviews (first 20) to eliminate O(PRs) separate API calls.
   # This is a significant performance optimization - instead of fetching reviews
   # separately for each PR, we get them in the same query.
-  # Trade-off: Limited to 20 reviews per PR (acceptable for most use cases).
-  PRS_QUERY = <<~GRAPHQL
-    query($owner: String!, $repo: String!, $cursor: String) {
-      repository(owner: $owner, name: $repo) {
-        pullRequests(first: 100, after: $cursor, orderBy: {field: CREATED_AT, direction: DESC}) {
+  # PRs with more than 20 reviews report hasNextPage and have the rest fetched
+  # with REVIEWS_QUERY, so only those PRs cost an extra call.
+  PULL_REQUESTS_CONNECTION = <<~GRAPHQL
+    pullRequests(first: 100, after: %<cursor>s, orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number
+        createdAt
+        mergedAt
+        author { login }
+        additions
+        deletions
+        reviews(first: 20) {
           pageInfo { hasNextPage endCursor }
           nodes {
-            number
-            createdAt
-            mergedAt
-            state
             author { login }
-            additions
-            deletions
-            reviews(first: 20) {
-              nodes {
-                author { login }
-                submittedAt
-                state
-              }
-            }
+            submittedAt
           }
         }
       }
     }
   GRAPHQL
 
-  COMMITS_QUERY = <<~GRAPHQL
-    query($owner: String!, $repo: String!, $since: GitTimestamp!, $cursor: String) {
+  REVIEWS_QUERY = <<~GRAPHQL
+    query($owner: String!, $repo: String!, $number: Int!, $cursor: String) {
       repository(owner: $owner, name: $repo) {
-        defaultBranchRef {
-          target {
-            ... on Commit {
-              history(first: 100, after: $cursor, since: $since) {
-                pageInfo { hasNextPage endCursor }
-                nodes {
-                  author {
-                    user { login }
-                    name
-                    date
-                  }
-                  additions
-                  deletions
-                }
+        pullRequest(number: $number) {
+          reviews(first: 100, after: $cursor) {
+            pageInfo { hasNextPage endCursor }
+            nodes {
+              author { login }
+              submittedAt
+            }
+          }
+        }
+      }
+    }
+  GRAPHQL
+
+  COMMIT_HISTORY_CONNECTION = <<~GRAPHQL
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: 100, after: %<cursor>s, since: $since) {
+            pageInfo { hasNextPage endCursor }
+            nodes {
+              author {
+                user { login }
+                name
+                date
               }
+              additions
+              deletions
             }
           }
         }
@@ -84,28 +125,31 @@ class GithubService
   GRAPHQL
 
   class << self
-    def fetch_sprint_data(start_date, end_date)
+    # @param force [Boolean] When true, refetch the repository list instead
+    #   of reading it from the cache
+    def fetch_sprint_data(start_date, end_date, force: false)
       validate_github_org!
 
       since_date = start_date.to_s
       until_date = end_date.to_s
       since_iso = "#{since_date}T00:00:00Z"
+      window_end = day_after(until_date)
       org = config.github_org
 
       log "Fetching sprint #{since_date} to #{until_date} for org: #{org}"
 
       # Step 1: Get all active repos
       log "  Step 1: Fetching repositories..."
-      all_repos = fetch_all_pages(REPOS_QUERY, { org: org }, %w[organization repositories])
+      all_repos = fetch_repositories(org, since_date, force: force)
       if all_repos.empty?
         log "  No repositories found"
         return empty_response
       end
-      log "  Found #{all_repos.size} total repositories"
+      log "  Found #{all_repos.size} repositories pushed since #{since_date}"
 
       # Step 2: Filter to repos with activity in sprint window
       active_repos = all_repos.select do |r|
-        !r["isArchived"] && !r["isFork"] && extract_date(r["pushedAt"]) >= since_date
+        !r["isArchived"] && !r["isFork"] && r["pushedAt"].to_s >= since_date
       end
       if active_repos.empty?
         log "  No active repositories in sprint window"
@@ -113,34 +157,38 @@ class GithubService
       end
       log "  Step 2: #{active_repos.size} repos with activity in sprint window"
 
-      # Step 3: Fetch PRs for each active repo (reviews are now inline in the query)
-      log "  Step 3: Fetching PRs from #{active_repos.size} repos..."
+      # Step 3: Fetch PRs (reviews are inline in the query) and commits for the
+      # active repos, REPO_BATCH_SIZE repos per request.
+      log "  Step 3: Fetching PRs and commits from #{active_repos.size} repos..."
+      repo_names = active_repos.map { |r| r["name"] }
+      # PRs come back newest first, so a repo is done once a page reaches PRs
+      # created before the window. Commit history is already bounded by `since`.
+      prs_by_repo = fetch_repo_connections(
+        org, repo_names, PULL_REQUESTS_CONNECTION, %w[pullRequests],
+        stop_when: ->(nodes) { nodes.last&.dig("createdAt").to_s < since_date }
+      )
+      commits_by_repo = fetch_repo_connections(
+        org, repo_names, COMMIT_HISTORY_CONNECTION, %w[defaultBranchRef target history],
+        since: [ "GitTimestamp!", since_iso ]
+      )
+
       all_prs = []
-      active_repos.each_with_index do |repo, i|
-        prs = fetch_all_pages(PRS_QUERY, { owner: org, repo: repo["name"] }, %w[repository pullRequests])
-        prs_in_window = prs.select do |pr|
-          created_date = extract_date(pr["createdAt"])
-          created_date >= since_date && created_date <= until_date
+      all_commits = []
+      repo_names.each_with_index do |name, i|
+        prs_in_window = prs_by_repo[name].select do |pr|
+          created_at = pr["createdAt"].to_s
+          created_at >= since_date && created_at < window_end
         end
-        prs_in_window.each { |pr| pr["_repo"] = repo["name"] }
+        prs_in_window.each { |pr| pr["_repo"] = name }
+        commits = commits_by_repo[name]
         all_prs.concat(prs_in_window)
-        log "    [#{i + 1}/#{active_repos.size}] #{repo['name']}: #{prs_in_window.size} PRs" if prs_in_window.any?
-      end
-      log "  Found #{all_prs.size} total PRs in sprint window"
-
-      # Step 4: Fetch commits for each active repo
-      log "  Step 4: Fetching commits from #{active_repos.size} repos..."
-      all_commits = []
-      active_repos.each_with_index do |repo, i|
-        commits = fetch_all_pages(
-          COMMITS_QUERY,
-          { owner: org, repo: repo["name"], since: since_iso },
-          %w[repository defaultBranchRef target history]
-        )
         all_commits.concat(commits)
-        log "    [#{i + 1}/#{active_repos.size}] #{repo['name']}: #{commits.size} commits" if commits.any?
+        if prs_in_window.any? || commits.any?
+          log "    [#{i + 1}/#{repo_names.size}] #{name}: #{prs_in_window.size} PRs, #{commits.size} commits"
+        end
       end
-      log "  Found #{all_commits.size} total commits"
+      log "  Step 4: Found #{all_prs.size} total PRs in sprint window and #{all_commits.size} total commits"
+      fetch_remaining_reviews(org, all_prs)
 
       # Step 5: Process into dashboard format
       log "  Step 5: Aggregating data..."
@@ -155,14 +203,7 @@ class GithubService
       {
         "developers" => [],
         "daily_activity" => [],
-        "summary" => {
-          "total_commits" => 0,
-          "total_prs" => 0,
-          "total_merged" => 0,
-          "total_reviews" => 0,
-          "developer_count" => 0,
-          "avg_dxi_score" => 0
-        },
+        "summary" => DxiCalculator.team_summary([]),
         "team_dimension_scores" => DxiCalculator.team_dimension_scores([])
       }
     end
@@ -244,6 +285,16 @@ class GithubService
       end
     end
 
+    # Shared GraphQL connection, built once instead of per page. The token is
+    # still read on every request so a rotated GH_TOKEN takes effect.
+    def graphql_connection
+      @graphql_connection ||= Faraday.new(url: GITHUB_GRAPHQL_URL) do |f|
+        f.headers["Content-Type"] = "application/json"
+        f.options.timeout = 30        # Read timeout (seconds)
+        f.options.open_timeout = 10   # Connection timeout (seconds)
+      end
+    end
+
     # Fetches all pages of a REST API endpoint.
     # GitHub REST pagination uses the Link header with rel="next".
     #
@@ -326,6 +377,12 @@ class GithubService
       iso_timestamp.to_s[0, 10]
     end
 
+    # Exclusive upper bound for ISO 8601 timestamps within until_date.
+    # Example: "2026-01-20" -> "2026-01-21"
+    def day_after(date_string)
+      Date.parse(date_string).next_day.to_s
+    end
+
     def validate_github_org!
       raise GitHubApiError, "GITHUB_ORG environment variable not set" if config.github_org.blank?
     end
@@ -335,18 +392,16 @@ class GithubService
         raise GitHubApiError, "GH_TOKEN not set. Create one at https://github.com/settings/tokens"
       end
 
-      response = Faraday.post(GITHUB_GRAPHQL_URL) do |req|
-        req.options.timeout = 30        # Read timeout (seconds)
-        req.options.open_timeout = 10   # Connection timeout (seconds)
+      response = graphql_connection.post do |req|
         req.headers["Authorization"] = "Bearer #{token}"
-        req.headers["Content-Type"] = "application/json"
         req.body = { query: query, variables: variables }.to_json
       end
 
-      body = JSON.parse(response.body)
-
       case response.status
       when 200
+        # Only successful responses are parsed; error statuses are classified
+        # from the status and headers alone (their bodies may not even be JSON).
+        body = JSON.parse(response.body)
         if body["errors"] && body["data"].nil?
           raise GitHubApiError, "GraphQL error: #{body['errors'].map { |e| e['message'] }.join('; ')}"
         end
@@ -371,9 +426,13 @@ class GithubService
       raise GitHubApiError, "Connection failed: #{e.message}"
     end
 
-    def fetch_all_pages(query, variables, path)
+    # Fetches every page of a single GraphQL connection.
+    #
+    # @param cursor [String, nil] cursor to resume after
+    # @param stop_when [Proc, nil] called with each page of nodes; truthy
+    #   means no later page is needed
+    def fetch_all_pages(query, variables, path, cursor: nil, stop_when: nil)
       all_nodes = []
-      cursor = nil
       pages_fetched = 0
       max_pages = config.max_pages_per_query
 
@@ -392,6 +451,7 @@ class GithubService
 
         page_info = connection["pageInfo"] || {}
         break unless page_info["hasNextPage"]
+        break if stop_when&.call(nodes)
 
         cursor = page_info["endCursor"]
         pages_fetched += 1
@@ -400,18 +460,171 @@ class GithubService
       all_nodes
     end
 
+    # Repos are ordered by PUSHED_AT DESC, so paging stops at the first page
+    # that reaches repos last pushed before the window; none after it can be
+    # active. The result therefore depends on since_date, which is part of
+    # the cache key. force skips the cache read; the fetched list is still
+    # written back.
+    def fetch_repositories(org, since_date, force: false)
+      ttl = REPOS_CACHE_TTL * rand((1 - REPOS_CACHE_JITTER)..(1 + REPOS_CACHE_JITTER))
+      Rails.cache.fetch([ "github_repos", org, since_date ], force: force, expires_in: ttl, race_condition_ttl: 30.seconds) do
+        fetch_all_pages(
+          REPOS_QUERY, { org: org }, %w[organization repositories],
+          stop_when: ->(nodes) { nodes.last&.dig("pushedAt").to_s < since_date }
+        )
+      end
+    end
+
+    # Completes the review list of PRs with more reviews than the inline first
+    # page holds. Most PRs fit in that page, so this is usually a no-op.
+    def fetch_remaining_reviews(org, prs)
+      truncated = prs.select { |pr| pr.dig("reviews", "pageInfo", "hasNextPage") }
+      return if truncated.empty?
+
+      log "    Fetching remaining reviews for #{truncated.size} PRs..."
+      remaining = map_concurrently(truncated) do |pr|
+        fetch_all_pages(
+          REVIEWS_QUERY,
+          { owner: org, repo: pr["_repo"], number: pr["number"] },
+          %w[repository pullRequest reviews],
+          cursor: pr.dig("reviews", "pageInfo", "endCursor")
+        )
+      end
+      truncated.zip(remaining) { |pr, reviews| (pr["reviews"]["nodes"] ||= []).concat(reviews) }
+    end
+
+    # Fetches every page of a per-repo connection for many repos. Repos are
+    # aliased into documents of up to REPO_BATCH_SIZE, batches run
+    # concurrently, and each round only re-requests the repos whose
+    # connection reported another page and whose last page did not satisfy
+    # stop_when.
+    #
+    # @param org [String] repository owner
+    # @param repo_names [Array<String>] repositories to fetch
+    # @param connection [String] selection template (see PULL_REQUESTS_CONNECTION)
+    # @param path [Array<String>] keys from the repository to the connection
+    # @param stop_when [Proc, nil] called with a repo's latest page of nodes;
+    #   truthy means no further pages are needed for that repo
+    # @param variables [Hash{Symbol => Array(String, Object)}] extra variables as [type, value]
+    # @return [Hash{String => Array<Hash>}] connection nodes per repo name
+    def fetch_repo_connections(org, repo_names, connection, path, stop_when: nil, **variables)
+      nodes_by_repo = repo_names.index_with { [] }
+      cursors = repo_names.index_with { nil }
+      pages_fetched = 0
+      max_pages = config.max_pages_per_query
+
+      while cursors.any? && pages_fetched < max_pages
+        batches = cursors.each_slice(REPO_BATCH_SIZE).to_a
+        results = map_concurrently(batches) do |batch|
+          fetch_repo_batch(org, batch, connection, path, variables)
+        end
+
+        cursors = {}
+        results.each do |batch_result|
+          batch_result.each do |name, (nodes, next_cursor)|
+            nodes_by_repo[name].concat(nodes)
+            cursors[name] = next_cursor if next_cursor && !stop_when&.call(nodes)
+          end
+        end
+        pages_fetched += 1
+      end
+
+      nodes_by_repo
+    end
+
+    # Fetches one page of the connection for each [repo_name, cursor] pair in
+    # a single aliased GraphQL request.
+    #
+    # @return [Hash{String => Array(Array<Hash>, String)}] nodes and next-page
+    #   cursor (nil when done) per repo name
+    def fetch_repo_batch(org, batch, connection, path, variables)
+      declarations = [ "$owner: String!" ]
+      query_variables = { owner: org }
+      variables.each do |name, (type, value)|
+        declarations << "$#{name}: #{type}"
+        query_variables[name] = value
+      end
+
+      fields = batch.each_with_index.map do |(name, cursor), i|
+        declarations << "$name#{i}: String!" << "$cursor#{i}: String"
+        query_variables[:"name#{i}"] = name
+        query_variables[:"cursor#{i}"] = cursor
+        "r#{i}: repository(owner: $owner, name: $name#{i}) {\n#{format(connection, cursor: "$cursor#{i}")}}"
+      end
+      query = "query(#{declarations.join(', ')}) {\nrateLimit { cost remaining }\n#{fields.join("\n")}\n}"
+
+      data = run_graphql(query, query_variables)&.dig("data") || {}
+      if (rate_limit = data["rateLimit"])
+        Rails.logger.debug { "[GithubService] Batch of #{batch.size} repos cost #{rate_limit['cost']} points, #{rate_limit['remaining']} remaining" }
+      end
+
+      batch.each_with_index.to_h do |(name, _), i|
+        conn = data.dig("r#{i}", *path)
+        next [ name, [ [], nil ] ] unless conn
+
+        page_info = conn["pageInfo"] || {}
+        next_cursor = page_info["endCursor"] if page_info["hasNextPage"]
+        [ name, [ conn["nodes"] || [], next_cursor ] ]
+      end
+    end
+
+    # Maps items through the block on up to config.github_concurrency threads
+    # (GITHUB_CONCURRENCY, default 4). Each fetch is network-bound, so a few
+    # threads hide most of the round-trip latency while staying clear of
+    # GitHub's secondary rate limits on concurrent requests. Results come back
+    # in input order. The first exception raised by any block stops the
+    # remaining work and is re-raised in the caller once every worker is done.
+    #
+    # Calls are never nested (the batch, commit and review rounds of a sprint
+    # fetch run one after another), so one sprint fetch has at most
+    # github_concurrency requests in flight. The refresh job and the sprints
+    # rake tasks fetch two sprints at a time, so they peak at twice that.
+    def map_concurrently(items)
+      return items.map { |item| yield(item) } if items.size <= 1
+
+      queue = Queue.new
+      items.each_with_index { |item, i| queue << [ item, i ] }
+      queue.close
+
+      results = Array.new(items.size)
+      errors = Queue.new
+      workers = Array.new([ config.github_concurrency, items.size ].min) do
+        Thread.new do
+          while (entry = queue.pop)
+            item, i = entry
+            begin
+              results[i] = yield(item)
+            rescue StandardError => e
+              queue.clear
+              errors << e
+              break
+            end
+          end
+        end
+      end
+      workers.each(&:join)
+      raise errors.pop unless errors.empty?
+
+      results
+    end
+
     # Aggregates raw GitHub data into developer metrics and daily activity.
     # Each step is extracted into a focused private method for testability.
+    #
+    # Timestamps are compared as full ISO 8601 strings against since_date and
+    # window_end (the day after until_date, exclusive), which orders the same
+    # as comparing their date prefix. Only counted rows are sliced to a date.
     def aggregate_data(prs, commits, since_date, until_date)
       developer_stats = initialize_developer_stats
       daily_stats = initialize_daily_stats
+      window_end = day_after(until_date)
 
-      process_commits(commits, developer_stats, daily_stats, since_date, until_date)
-      process_prs(prs, developer_stats, daily_stats, since_date, until_date)
+      process_commits(commits, developer_stats, daily_stats, since_date, window_end)
+      process_prs(prs, developer_stats, daily_stats, since_date, window_end)
 
       developers = build_developers_with_scores(developer_stats)
       daily_activity = build_daily_activity(daily_stats, since_date, until_date)
-      summary = build_summary(developers)
+      summary = DxiCalculator.team_summary(developers)
 
       {
         "developers" => developers,
@@ -422,114 +635,108 @@ class GithubService
     end
 
     def initialize_developer_stats
-      Hash.new do |h, k|
-        h[k] = {
-          "commits" => 0, "prs_opened" => 0, "prs_merged" => 0,
-          "reviews_given" => 0, "lines_added" => 0, "lines_deleted" => 0,
-          "review_times" => [], "cycle_times" => []
-        }
-      end
+      Hash.new { |h, k| h[k] = DeveloperStats.new(0, 0, 0, 0, 0, 0, [], []) }
     end
 
     def initialize_daily_stats
-      Hash.new do |h, k|
-        h[k] = { "commits" => 0, "prs_opened" => 0, "prs_merged" => 0, "reviews_given" => 0 }
-      end
+      Hash.new { |h, k| h[k] = DailyStats.new(0, 0, 0, 0) }
     end
 
-    def process_commits(commits, developer_stats, daily_stats, since_date, until_date)
+    def process_commits(commits, developer_stats, daily_stats, since_date, window_end)
       commits.each do |commit|
         author = commit.dig("author") || {}
         login = author.dig("user", "login") || author["name"].to_s
-        next if login.blank? || login.end_with?("[bot]")
+        next if login.blank? || login.end_with?(BOT_SUFFIX)
 
-        commit_date = extract_date(author["date"])
-        next if commit_date < since_date || commit_date > until_date
+        committed_at = author["date"].to_s
+        next if committed_at < since_date || committed_at >= window_end
 
-        developer_stats[login]["commits"] += 1
-        developer_stats[login]["lines_added"] += commit["additions"].to_i
-        developer_stats[login]["lines_deleted"] += commit["deletions"].to_i
-        daily_stats[commit_date]["commits"] += 1
+        commit_date = extract_date(committed_at)
+
+        stats = developer_stats[login]
+        stats.commits += 1
+        stats.lines_added += commit["additions"].to_i
+        stats.lines_deleted += commit["deletions"].to_i
+        daily_stats[commit_date].commits += 1
       end
     end
 
-    def process_prs(prs, developer_stats, daily_stats, since_date, until_date)
+    def process_prs(prs, developer_stats, daily_stats, since_date, window_end)
       prs.each do |pr|
         created_at = pr["createdAt"].to_s
-        created_date = extract_date(created_at)
-        next if created_date < since_date || created_date > until_date
+        next if created_at < since_date || created_at >= window_end
 
         author = pr.dig("author", "login").to_s
-        next if author.blank? || author.end_with?("[bot]")
-
-        developer_stats[author]["prs_opened"] += 1
-        developer_stats[author]["lines_added"] += pr["additions"].to_i
-        developer_stats[author]["lines_deleted"] += pr["deletions"].to_i
-        daily_stats[created_date]["prs_opened"] += 1
-
-        process_merged_pr(pr, developer_stats, daily_stats, created_at, author, until_date)
-        process_reviews(pr, developer_stats, daily_stats, created_at, until_date)
+        next if author.blank? || author.end_with?(BOT_SUFFIX)
+
+        stats = developer_stats[author]
+        stats.prs_opened += 1
+        stats.lines_added += pr["additions"].to_i
+        stats.lines_deleted += pr["deletions"].to_i
+        daily_stats[extract_date(created_at)].prs_opened += 1
+
+        # Parsed once per PR and shared by the cycle-time and every review's
+        # turnaround calculation. GitHub timestamps are strict ISO 8601, so
+        # Time.iso8601 skips Time.parse's format guessing.
+        created_time = Time.iso8601(created_at)
+        process_merged_pr(pr, stats, daily_stats, created_time, window_end)
+        process_reviews(pr, developer_stats, daily_stats, created_time, window_end)
       end
     end
 
-    def process_merged_pr(pr, developer_stats, daily_stats, created_at, author, until_date)
+    def process_merged_pr(pr, author_stats, daily_stats, created_time, window_end)
       merged_at = pr["mergedAt"]
       return unless merged_at.present?
+      return if merged_at >= window_end
 
-      merged_date = extract_date(merged_at)
-      return if merged_date > until_date
-
-      developer_stats[author]["prs_merged"] += 1
-      daily_stats[merged_date]["prs_merged"] += 1
+      author_stats.prs_merged += 1
+      daily_stats[extract_date(merged_at)].prs_merged += 1
 
       # Calculate cycle time (PR creation to merge)
-      cycle_hours = (Time.parse(merged_at) - Time.parse(created_at)) / 3600.0
-      developer_stats[author]["cycle_times"] << cycle_hours
+      cycle_hours = (Time.iso8601(merged_at) - created_time) / 3600.0
+      author_stats.cycle_times << cycle_hours
     end
 
-    def process_reviews(pr, developer_stats, daily_stats, pr_created_at, until_date)
+    def process_reviews(pr, developer_stats, daily_stats, pr_created_time, window_end)
       reviews = pr.dig("reviews", "nodes") || []
 
       reviews.each do |review|
         reviewer = review.dig("author", "login").to_s
-        next if reviewer.blank? || reviewer.end_with?("[bot]")
+        next if reviewer.blank? || reviewer.end_with?(BOT_SUFFIX)
 
         submitted_at = review["submittedAt"]
         next unless submitted_at.present?
+        next if submitted_at >= window_end
 
-        review_date = extract_date(submitted_at)
-        next if review_date > until_date
-
-        developer_stats[reviewer]["reviews_given"] += 1
-        daily_stats[review_date]["reviews_given"] += 1
+        stats = developer_stats[reviewer]
+        stats.reviews_given += 1
+        daily_stats[extract_date(submitted_at)].reviews_given += 1
 
         # Calculate review turnaround (PR creation to first review)
-        review_hours = (Time.parse(submitted_at) - Time.parse(pr_created_at)) / 3600.0
-        developer_stats[reviewer]["review_times"] << review_hours if review_hours > 0
+        review_hours = (Time.iso8601(submitted_at) - pr_created_time) / 3600.0
+        stats.review_times << review_hours if review_hours > 0
       end
     end
 
     def build_developers_with_scores(developer_stats)
       developers = developer_stats.map do |login, stats|
-        avg_review = stats["review_times"].any? ? (stats["review_times"].sum / stats["review_times"].size) : nil
-        avg_cycle = stats["cycle_times"].any? ? (stats["cycle_times"].sum / stats["cycle_times"].size) : nil
+        avg_review = stats.review_times.any? ? (stats.review_times.sum / stats.review_times.size) : nil
+        avg_cycle = stats.cycle_times.any? ? (stats.cycle_times.sum / stats.cycle_times.size) : nil
 
         metrics = {
           "developer" => login,
           "github_login" => login,
-          "commits" => stats["commits"],
-          "prs_opened" => stats["prs_opened"],
-          "prs_merged" => stats["prs_merged"],
-          "reviews_given" => stats["reviews_given"],
-          "lines_added" => stats["lines_added"],
-          "lines_deleted" => stats["lines_deleted"],
+          "commits" => stats.commits,
+          "prs_opened" => stats.prs_opened,
+          "prs_merged" => stats.prs_merged,
+          "reviews_given" => stats.reviews_given,
+          "lines_added" => stats.lines_added,
+          "lines_deleted" => stats.lines_deleted,
           "avg_review_time_hours" => avg_review&.round(2),
           "avg_cycle_time_hours" => avg_cycle&.round(2)
         }
 
-        dimension_scores = DxiCalculator.dimension_scores(metrics)
-        metrics["dimension_scores"] = dimension_scores.transform_keys(&:to_s)
-        metrics["dxi_score"] = DxiCalculator.composite_score(dimension_scores)
+        metrics["dimension_scores"], metrics["dxi_score"] = DxiCalculator.developer_scores(metrics)
         metrics
       end
 
@@ -537,30 +744,19 @@ class GithubService
       developers.sort_by! { |d| -(d["dxi_score"] || 0) }
     end
 
-    def build_summary(developers)
-      {
-        "total_commits" => developers.sum { |d| d["commits"] },
-        "total_prs" => developers.sum { |d| d["prs_opened"] },
-        "total_merged" => developers.sum { |d| d["prs_merged"] },
-        "total_reviews" => developers.sum { |d| d["reviews_given"] },
-        "developer_count" => developers.size,
-        "avg_dxi_score" => developers.any? ? (developers.sum { |d| d["dxi_score"] } / developers.size.to_f).round(1) : 0
-      }
-    end
-
     def build_daily_activity(daily_stats, since_date, until_date)
       start = Date.parse(since_date)
       finish = Date.parse(until_date)
 
       (start..finish).map do |date|
         date_str = date.to_s
-        stats = daily_stats[date_str] || {}
+        stats = daily_stats[date_str]
         {
           "date" => date_str,
-          "commits" => stats["commits"] || 0,
-          "prs_opened" => stats["prs_opened"] || 0,
-          "prs_merged" => stats["prs_merged"] || 0,
-          "reviews_given" => stats["reviews_given"] || 0
+          "commits" => stats.commits,
+          "prs_opened" => stats.prs_opened,
+          "prs_merged" => stats.prs_merged,
+          "reviews_given" => stats.reviews_given
         }
       end
     end
@@ -40,10 +40,11 @@ class GithubSyncService
   # @return [Integer] Number of developers synced
   def sync_org_members
     members = @github.fetch_org_members
+    existing = Developer.where(github_id: members.map { |m| m["id"] }).index_by(&:github_id)
     count = 0
 
     members.each do |member|
-      dev = Developer.find_or_initialize_by(github_id: member["id"])
+      dev = existing[member["id"]] || Developer.new(github_id: member["id"])
       dev.assign_attributes(
         github_login: member["login"],
         avatar_url: member["avatar_url"],
@@ -65,10 +66,11 @@ class GithubSyncService
   # @return [Integer] Number of teams synced
   def sync_teams
     github_teams = @github.fetch_org_teams
+    existing = Team.where(github_team_id: github_teams.map { |t| t["id"] }).index_by(&:github_team_id)
     count = 0
 
     github_teams.each do |gh_team|
-      team = Team.find_or_initialize_by(github_team_id: gh_team["id"])
+      team = existing[gh_team["id"]] || Team.new(github_team_id: gh_team["id"])
       team.assign_attributes(
         name: gh_team["name"],
         slug: gh_team["slug"],
@@ -124,14 +126,14 @@ class GithubSyncService
     member_github_ids = members.map { |m| m["id"] }
 
     # Find matching developers in our DB
-    developers = Developer.where(github_id: member_github_ids)
-    developer_ids = developers.pluck(:id)
+    developer_ids = Developer.where(github_id: member_github_ids).pluck(:id)
 
     # Atomically update memberships: remove stale, add missing
     ActiveRecord::Base.transaction do
-      TeamMembership.where(team: team).where.not(developer_id: developer_ids).delete_all
-      developer_ids.each do |dev_id|
-        TeamMembership.find_or_create_by!(team: team, developer_id: dev_id)
+      memberships = TeamMembership.where(team: team)
+      memberships.where.not(developer_id: developer_ids).delete_all
+      (developer_ids - memberships.pluck(:developer_id)).each do |dev_id|
+        TeamMembership.create!(team: team, developer_id: dev_id)
       rescue ActiveRecord::RecordNotUnique
         # Already exists
       end
@@ -11,7 +11,33 @@
 #   SprintLoader.new.load(start_date, end_date, force: true)
 #   SprintLoader.new(fetcher: MockFetcher).load(...)  # for testing
 class SprintLoader
-  # @param fetcher [#fetch_sprint_data] Any object that responds to fetch_sprint_data(start_date, end_date)
+  # One lock per sprint (keyed by dates), shared by every loader in the
+  # process. Concurrent loads of the same sprint then make a single GitHub
+  # fetch: later callers wait for it and reuse the row it stored.
+  #
+  # Each entry is [mutex, number of callers using it] and is removed when
+  # the last caller leaves, so the map only holds sprints being loaded right
+  # now (the dates come from request params).
+  FETCH_LOCKS = {}
+  FETCH_LOCKS_GUARD = Mutex.new
+  private_constant :FETCH_LOCKS, :FETCH_LOCKS_GUARD
+
+  def self.with_fetch_lock(key)
+    entry = FETCH_LOCKS_GUARD.synchronize do
+      (FETCH_LOCKS[key] ||= [ Mutex.new, 0 ]).tap { |e| e[1] += 1 }
+    end
+
+    entry[0].synchronize { yield }
+  ensure
+    if entry
+      FETCH_LOCKS_GUARD.synchronize do
+        entry[1] -= 1
+        FETCH_LOCKS.delete(key) if entry[1].zero?
+      end
+    end
+  end
+
+  # @param fetcher [#fetch_sprint_data] Any object that responds to fetch_sprint_data(start_date, end_date, force:)
   def initialize(fetcher: GithubService)
     @fetcher = fetcher
   end
@@ -29,29 +55,45 @@ class SprintLoader
   # @param force [Boolean] When true, refetch data even if cached
   # @return [Sprint] The loaded or created Sprint record
   def load(start_date, end_date, force: false)
-    start_date = Date.parse(start_date.to_s)
-    end_date = Date.parse(end_date.to_s)
+    start_date = to_date(start_date)
+    end_date = to_date(end_date)
 
     # Check cache first (outside transaction - no lock held)
     sprint = Sprint.find_by_dates(start_date, end_date)
     return sprint if sprint && !force
 
+    requested_at = Time.current
+    self.class.with_fetch_lock([ start_date, end_date ]) do
+      # Another caller may have fetched this sprint while we waited for the
+      # lock. fetched_at moves even when that fetch found identical data.
+      sprint = Sprint.find_by_dates(start_date, end_date)
+      next sprint if sprint && (!force || (sprint.fetched_at && sprint.fetched_at >= requested_at))
+
+      fetch_and_store(start_date, end_date, force: force)
+    end
+  rescue ActiveRecord::RecordNotUnique
+    # Another request created the sprint while we were fetching data
+    Sprint.find_by_dates(start_date, end_date)
+  end
+
+  private
+
+  # Controllers and the refresh job already pass Date objects; only strings
+  # (and other date-like values) need a round trip through the parser.
+  def to_date(value)
+    value.instance_of?(Date) ? value : Date.parse(value.to_s)
+  end
+
+  def fetch_and_store(start_date, end_date, force:)
     # Fetch data OUTSIDE transaction - this is slow and should not hold a DB lock
-    data = @fetcher.fetch_sprint_data(start_date, end_date)
+    data = @fetcher.fetch_sprint_data(start_date, end_date, force: force)
 
     # Quick transaction for DB write only (minimal lock time)
     Sprint.transaction do
       # Re-check in case another request created it while we were fetching
-      sprint = Sprint.find_by_dates(start_date, end_date)
-      if sprint
-        sprint.update!(data: data)
-        sprint
-      else
-        Sprint.create!(start_date: start_date, end_date: end_date, data: data)
-      end
+      sprint = Sprint.find_by_dates(start_date, end_date) ||
+        Sprint.new(start_date: start_date, end_date: end_date)
+      sprint.store_fetched_data!(data)
     end
-  rescue ActiveRecord::RecordNotUnique
-    # Another request created the sprint while we were fetching data
-    Sprint.find_by_dates(start_date, end_date)
   end
 end
@@ -0,0 +1,19 @@
+# frozen_string_literal: true
+
+# JSON column type that encodes with the json gem's C generator.
+#
+# ActiveRecord's :json type encodes through ActiveSupport::JSON, which walks
+# the whole value through as_json and escapes HTML entities before generating.
+# Sprint data is plain JSON built from GitHub responses, so for large blobs the
+# native generator writes an equivalent document much faster. Values holding
+# anything other than JSON-native objects (a Time, a NaN) fall back to the
+# ActiveSupport encoding so they are stored exactly as before.
+class JsonBlobType < ActiveRecord::Type::Json
+  def serialize(value)
+    return if value.nil?
+
+    JSON.generate(value, strict: true)
+  rescue JSON::GeneratorError
+    super
+  end
+end
@@ -7,6 +7,12 @@
 # In production, configure via CORS_ORIGINS env var.
 #
 # IMPORTANT: credentials: true is required for session cookies to work cross-origin
+#
+# Allowed request headers are listed explicitly (the frontend only sends
+# Content-Type) rather than `:any`, which makes rack-cors echo back whatever
+# each preflight asks for. max_age lets browsers cache preflight results.
+
+allowed_headers = %w[Content-Type Authorization].freeze
 
 Rails.application.config.middleware.insert_before 0, Rack::Cors do
   allow do
@@ -14,13 +20,14 @@ Rails.application.config.middleware.insert_before 0, Rack::Cors do
 
     # OAuth routes
     resource "/auth/*",
-      headers: :any,
+      headers: allowed_headers,
       methods: %i[get delete options],
-      credentials: true
+      credentials: true,
+      max_age: 86400
 
     # API routes
     resource "/api/*",
-      headers: :any,
+      headers: allowed_headers,
       methods: %i[get post put patch delete options head],
       credentials: true,
       max_age: 86400
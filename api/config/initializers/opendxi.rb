@@ -8,4 +8,5 @@ Rails.application.configure do
   config.opendxi.sprint_start_date = Date.parse(ENV.fetch("SPRINT_START_DATE", "2026-01-07"))
   config.opendxi.sprint_duration_days = ENV.fetch("SPRINT_DURATION_DAYS", "14").to_i
   config.opendxi.max_pages_per_query = ENV.fetch("MAX_PAGES_PER_QUERY", "10").to_i
+  config.opendxi.github_concurrency = ENV.fetch("GITHUB_CONCURRENCY", "4").to_i.clamp(1, 8)
 end
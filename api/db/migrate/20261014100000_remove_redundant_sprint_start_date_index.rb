@@ -0,0 +1,8 @@
+class RemoveRedundantSprintStartDateIndex < ActiveRecord::Migration[8.1]
+  def change
+    # index_sprints_on_dates_unique leads with start_date, so it already serves
+    # ORDER BY start_date (history, external contributor scan) and the range
+    # scopes. The single-column copy only added work to every sprint write.
+    remove_index :sprints, :start_date, name: "index_sprints_on_start_date"
+  end
+end
@@ -0,0 +1,15 @@
+class AddFetchedAtToSprints < ActiveRecord::Migration[8.1]
+  def up
+    # When the data was last fetched from GitHub. Unlike updated_at it moves
+    # on every fetch, including one that returns identical data (which
+    # Active Record would otherwise skip saving).
+    add_column :sprints, :fetched_at, :datetime
+
+    # Until now updated_at was the closest record of the last fetch
+    execute "UPDATE sprints SET fetched_at = updated_at"
+  end
+
+  def down
+    remove_column :sprints, :fetched_at
+  end
+end
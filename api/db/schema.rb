@@ -10,7 +10,7 @@
 #
 # It's strongly recommended that you check this file into your version control system.
 
-ActiveRecord::Schema[8.1].define(version: 2026_02_04_090958) do
+ActiveRecord::Schema[8.1].define(version: 2026_10_14_110000) do
   create_table "developers", force: :cascade do |t|
     t.string "avatar_url"
     t.datetime "created_at", null: false
@@ -41,10 +41,10 @@ ActiveRecord::Schema[8.1].define(version: 2026_02_04_090958) do
     t.datetime "created_at", null: false
     t.json "data"
     t.date "end_date", null: false
+    t.datetime "fetched_at"
     t.date "start_date", null: false
     t.datetime "updated_at", null: false
     t.index ["start_date", "end_date"], name: "index_sprints_on_dates_unique", unique: true
-    t.index ["start_date"], name: "index_sprints_on_start_date"
     t.index ["updated_at"], name: "index_sprints_on_updated_at"
   end
 
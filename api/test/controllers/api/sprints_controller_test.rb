@@ -4,6 +4,8 @@ require "test_helper"
 
 module Api
   class SprintsControllerTest < ActionDispatch::IntegrationTest
+    include ActiveJob::TestHelper
+
     setup do
       # Authenticate before each test
       sign_in_as
@@ -65,6 +67,48 @@ module Api
       assert_kind_of Array, json["sprints"]
     end
 
+    test "index shows the new current sprint as soon as it starts" do
+      config = Rails.application.config.opendxi
+      next_start = Sprint.available_sprints(limit: 1).first[:end_date] + 1
+
+      Rails.stub(:cache, ActiveSupport::Cache::MemoryStore.new) do
+        get "/api/sprints"
+        travel_to next_start.beginning_of_day + 1.hour do
+          sign_in_as # the session from setup has expired by now
+          Sprint.create!(start_date: next_start, end_date: next_start + config.sprint_duration_days - 1, data: sample_sprint_data)
+
+          get "/api/sprints"
+          current = JSON.parse(response.body)["sprints"].first
+          assert_equal next_start.to_s, current["start"]
+        end
+      end
+    end
+
+    test "index rebuilds the cached list when a sprint is stored" do
+      Rails.stub(:cache, ActiveSupport::Cache::MemoryStore.new) do
+        get "/api/sprints"
+        body = response.body
+
+        # Same day, same payload: served from the cache
+        Sprint.stub(:available_sprints, ->(**) { flunk "list should come from the cache" }) do
+          get "/api/sprints"
+        end
+        assert_equal body, response.body
+
+        travel 1.second do
+          @sprint.store_fetched_data!(sample_sprint_data.merge("summary" => { "total_commits" => 1 }))
+        end
+
+        calls = 0
+        available_sprints = Sprint.method(:available_sprints)
+        Sprint.stub(:available_sprints, ->(**kwargs) { calls += 1; available_sprints.call(**kwargs) }) do
+          get "/api/sprints"
+        end
+        assert_response :success
+        assert_equal 1, calls, "a newly stored sprint should rebuild the list"
+      end
+    end
+
     test "history returns sprint history" do
       get "/api/sprints/history"
 
@@ -176,6 +220,117 @@ module Api
         "ETag should be based on sprint cache key"
     end
 
+    test "metrics accepts force_refresh=1 and force_refresh=true" do
+      %w[1 true].each do |value|
+        forced = nil
+        find_or_fetch = ->(_start_date, _end_date, force:) { forced = force; @sprint }
+
+        Sprint.stub(:find_or_fetch!, find_or_fetch) do
+          get "/api/sprints/#{@sprint.start_date}/#{@sprint.end_date}/metrics?force_refresh=#{value}"
+        end
+
+        assert_response :ok
+        assert forced, "force_refresh=#{value} should force a refetch"
+      end
+    end
+
+    test "metrics ignores other force_refresh values" do
+      forced = nil
+      find_or_fetch = ->(_start_date, _end_date, force:) { forced = force; @sprint }
+
+      Sprint.stub(:find_or_fetch!, find_or_fetch) do
+        get "/api/sprints/#{@sprint.start_date}/#{@sprint.end_date}/metrics?force_refresh=yes"
+      end
+
+      assert_response :ok
+      assert_equal false, forced
+    end
+
+    test "metrics serves stale current sprint and enqueues a background refresh" do
+      @sprint.update_columns(fetched_at: Sprint::STALE_AFTER.ago - 1.minute)
+
+      assert_enqueued_with(job: RefreshGithubDataJob) do
+        get "/api/sprints/#{@sprint.start_date}/#{@sprint.end_date}/metrics"
+      end
+
+      assert_response :ok
+    end
+
+    test "metrics does not enqueue a refresh for fresh data" do
+      @sprint.update_columns(fetched_at: Time.current)
+
+      assert_no_enqueued_jobs(only: RefreshGithubDataJob) do
+        get "/api/sprints/#{@sprint.start_date}/#{@sprint.end_date}/metrics"
+      end
+    end
+
+    test "metrics does not enqueue a refresh after a refetch of unchanged data" do
+      stale_time = Sprint::STALE_AFTER.ago - 1.hour
+      @sprint.update_columns(updated_at: stale_time, fetched_at: stale_time)
+
+      # The hourly job refetches identical data: updated_at stays old
+      @sprint.store_fetched_data!(sample_sprint_data)
+      assert_equal stale_time.to_i, @sprint.reload.updated_at.to_i
+
+      assert_no_enqueued_jobs(only: RefreshGithubDataJob) do
+        get "/api/sprints/#{@sprint.start_date}/#{@sprint.end_date}/metrics"
+      end
+    end
+
+    test "metrics caches the body separately per team name" do
+      sprint = Sprint.create!(start_date: Date.current + 112, end_date: Date.current + 126, data: multi_developer_sprint_data)
+      mirror = Team.create!(name: "Backend Mirror", source: "custom")
+      mirror.developers << developers(:alice_dev) << developers(:bob_dev)
+
+      Rails.stub(:cache, ActiveSupport::Cache::MemoryStore.new) do
+        get "/api/sprints/#{sprint.start_date}/#{sprint.end_date}/metrics?team=backend"
+        backend_etag = response.headers["ETag"]
+        assert_equal "Backend", JSON.parse(response.body).dig("filter_meta", "team_name")
+
+        get "/api/sprints/#{sprint.start_date}/#{sprint.end_date}/metrics?team=#{mirror.slug}"
+        # Same members, so the same ETag, but the body must carry its own team name
+        assert_equal backend_etag, response.headers["ETag"]
+        assert_equal "Backend Mirror", JSON.parse(response.body).dig("filter_meta", "team_name")
+      end
+    end
+
+    test "metrics serves a fresh body after a refetch changes the data" do
+      sprint = Sprint.create!(start_date: Date.current + 112, end_date: Date.current + 126, data: multi_developer_sprint_data)
+
+      Rails.stub(:cache, ActiveSupport::Cache::MemoryStore.new) do
+        get "/api/sprints/#{sprint.start_date}/#{sprint.end_date}/metrics"
+        etag = response.headers["ETag"]
+
+        changed = multi_developer_sprint_data
+        changed["developers"].first["commits"] = 42
+        sprint.store_fetched_data!(changed)
+
+        get "/api/sprints/#{sprint.start_date}/#{sprint.end_date}/metrics"
+        assert_not_equal etag, response.headers["ETag"]
+        alice = JSON.parse(response.body)["developers"].find { |d| d["developer"] == "alice" }
+        assert_equal 42, alice["commits"]
+      end
+    end
+
+    test "metrics serves the cached body after a refetch of unchanged data" do
+      sprint = Sprint.create!(start_date: Date.current + 112, end_date: Date.current + 126, data: multi_developer_sprint_data)
+
+      Rails.stub(:cache, ActiveSupport::Cache::MemoryStore.new) do
+        get "/api/sprints/#{sprint.start_date}/#{sprint.end_date}/metrics"
+        etag = response.headers["ETag"]
+        body = response.body
+
+        sprint.store_fetched_data!(multi_developer_sprint_data)
+
+        MetricsResponseSerializer.stub(:new, ->(*, **) { flunk "body should come from the cache" }) do
+          get "/api/sprints/#{sprint.start_date}/#{sprint.end_date}/metrics"
+        end
+        assert_response :ok
+        assert_equal etag, response.headers["ETag"]
+        assert_equal body, response.body
+      end
+    end
+
     test "metrics sets cache control headers" do
       get "/api/sprints/#{@sprint.start_date}/#{@sprint.end_date}/metrics"
 
@@ -0,0 +1,38 @@
+# frozen_string_literal: true
+
+require "test_helper"
+
+class CorsTest < ActionDispatch::IntegrationTest
+  ORIGIN = "http://localhost:3001"
+
+  test "api preflight allows the listed headers and is cacheable for a day" do
+    preflight "/api/sprints", "Content-Type"
+
+    assert_equal ORIGIN, response.headers["Access-Control-Allow-Origin"]
+    assert_match(/content-type/i, response.headers["Access-Control-Allow-Headers"])
+    assert_equal "86400", response.headers["Access-Control-Max-Age"]
+  end
+
+  test "auth preflight is cacheable for a day" do
+    preflight "/auth/logout", "Content-Type", method: "DELETE"
+
+    assert_equal ORIGIN, response.headers["Access-Control-Allow-Origin"]
+    assert_equal "86400", response.headers["Access-Control-Max-Age"]
+  end
+
+  test "preflight asking for an unlisted header is not allowed" do
+    preflight "/api/sprints", "X-Custom-Header"
+
+    assert_nil response.headers["Access-Control-Allow-Origin"]
+  end
+
+  private
+
+  def preflight(path, request_headers, method: "GET")
+    process :options, path, headers: {
+      "Origin" => ORIGIN,
+      "Access-Control-Request-Method" => method,
+      "Access-Control-Request-Headers" => request_headers
+    }
+  end
+end
@@ -13,7 +13,7 @@ class RefreshGithubDataJobTest < ActiveJob::TestCase
       @call_index = 0
     end
 
-    def fetch_sprint_data(start_date, end_date)
+    def fetch_sprint_data(start_date, end_date, force: false)
       @calls << { start_date: start_date.to_s, end_date: end_date.to_s }
       raise @error if @error
       response = @responses[@call_index] || @responses.last
@@ -30,7 +30,7 @@ class RefreshGithubDataJobTest < ActiveJob::TestCase
       @call_count = 0
     end
 
-    def fetch_sprint_data(start_date, end_date)
+    def fetch_sprint_data(start_date, end_date, force: false)
       @call_count += 1
       if @call_count == 1
         raise GithubService::GitHubApiError, "Failed for first sprint"
@@ -66,6 +66,21 @@ class RefreshGithubDataJobTest < ActiveJob::TestCase
     assert_not_nil job_status.ran_at
   end
 
+  test "skips previous sprint once its stored data has settled" do
+    previous = Sprint.available_sprints(limit: 2).last
+    sprint = Sprint.create!(start_date: previous[:start_date], end_date: previous[:end_date], data: {})
+    sprint.update_column(:fetched_at, previous[:end_date].end_of_day + Sprint::SETTLE_PERIOD + 1.hour)
+    mock_fetcher = MockFetcher.new
+
+    with_mock_fetcher(mock_fetcher) do
+      RefreshGithubDataJob.perform_now
+    end
+
+    assert_equal 1, mock_fetcher.calls.size
+    assert_not_equal previous[:start_date].to_s, mock_fetcher.calls.first[:start_date]
+    assert_equal 2, JobStatus.find_by(name: "github_refresh").sprints_succeeded
+  end
+
   test "records failure status when Sprint.available_sprints raises API error" do
     with_stubbed_available_sprints(-> { raise GithubService::GitHubApiError, "Rate limited" }) do
       RefreshGithubDataJob.perform_now
@@ -94,6 +109,27 @@ class RefreshGithubDataJobTest < ActiveJob::TestCase
     assert_equal 1, job_status.sprints_failed
   end
 
+  test "finishes the other sprint before raising an unexpected error" do
+    current, previous = Sprint.available_sprints(limit: 2)
+    attempts = Queue.new
+    fetcher = Object.new
+    fetcher.define_singleton_method(:fetch_sprint_data) do |start_date, _end_date, force: false|
+      attempts << start_date
+      raise ArgumentError, "bad sprint data" if start_date == current[:start_date]
+
+      sleep 0.05 # still running when the other sprint fails
+      { "developers" => [], "summary" => {} }
+    end
+
+    with_mock_fetcher(fetcher) do
+      error = assert_raises(ArgumentError) { RefreshGithubDataJob.perform_now }
+      assert_equal "bad sprint data", error.message
+    end
+
+    assert_equal 2, attempts.size
+    assert_not_nil Sprint.find_by_dates(previous[:start_date], previous[:end_date])&.fetched_at
+  end
+
   test "handles Faraday connection errors gracefully and reports failed status" do
     mock_fetcher = MockFetcher.new(error: Faraday::ConnectionFailed.new("Connection refused"))
 
@@ -70,6 +70,20 @@ class SprintTest < ActiveSupport::TestCase
     assert_kind_of Array, @sprint.daily_activity
   end
 
+  test "data round-trips through the JSON column" do
+    stored = Sprint.connection.select_value("SELECT data FROM sprints WHERE id = #{@sprint.id}")
+
+    assert_equal JSON.generate(sample_sprint_data), stored
+    assert_equal sample_sprint_data, Sprint.find(@sprint.id).data
+  end
+
+  test "data with non-JSON values falls back to ActiveSupport encoding" do
+    time = Time.utc(2026, 1, 7, 10, 30)
+    @sprint.update!(data: { "developers" => [], "fetched_at" => time })
+
+    assert_equal time.as_json, @sprint.reload.data["fetched_at"]
+  end
+
   # ═══════════════════════════════════════════════════════════════════════════
   # Instance Methods
   # ═══════════════════════════════════════════════════════════════════════════
@@ -102,6 +116,40 @@ class SprintTest < ActiveSupport::TestCase
     assert_match %r{\w+ \d+ - \w+ \d+}, @sprint.label
   end
 
+  test "range_label reuses the label for the same dates" do
+    label = Sprint.range_label(@sprint.start_date, @sprint.end_date)
+
+    assert_same label, Sprint.find(@sprint.id).label
+  end
+
+  test "settled? is true once data was fetched after the settle period" do
+    @sprint.update_column(:fetched_at, @sprint.end_date.end_of_day + Sprint::SETTLE_PERIOD + 1.minute)
+    assert @sprint.settled?
+  end
+
+  test "settled? is false when data was fetched during the settle period" do
+    @sprint.update_column(:fetched_at, @sprint.end_date.end_of_day + 1.day)
+    assert_not @sprint.settled?
+  end
+
+  test "store_fetched_data! with identical data records the fetch without touching updated_at" do
+    updated_at = @sprint.updated_at
+    fetched_at = 1.minute.from_now
+
+    @sprint.store_fetched_data!(sample_sprint_data, fetched_at: fetched_at)
+    @sprint.reload
+
+    assert_equal fetched_at.to_i, @sprint.fetched_at.to_i
+    assert_equal updated_at, @sprint.updated_at
+  end
+
+  test "store_fetched_data! saves changed data" do
+    @sprint.store_fetched_data!({ "developers" => [] })
+
+    assert_equal [], @sprint.reload.developers
+    assert_not_nil @sprint.fetched_at
+  end
+
   test "find_developer returns developer by login" do
     dev = @sprint.find_developer("dev1")
     assert_not_nil dev
@@ -112,6 +160,28 @@ class SprintTest < ActiveSupport::TestCase
     assert_nil @sprint.find_developer("unknown")
   end
 
+  test "find_developer reflects reassigned data" do
+    assert @sprint.find_developer("dev1")
+
+    @sprint.data = { "developers" => [ { "developer" => "dev9", "github_login" => "dev9" } ] }
+
+    assert_nil @sprint.find_developer("dev1")
+    assert_equal "dev9", @sprint.find_developer("dev9")["developer"]
+  end
+
+  test "with_scores fills developer scores and team aggregates from raw metrics" do
+    raw = { "developers" => [ { "developer" => "dev1", "commits" => 20, "reviews_given" => 10 } ] }
+
+    scored = Sprint.with_scores(raw)
+    dev = scored["developers"].first
+
+    assert_equal 100.0, dev["dimension_scores"]["commit_frequency"]
+    assert_equal DxiCalculator.developer_scores(raw["developers"].first).last, dev["dxi_score"]
+    assert_equal 100.0, scored["team_dimension_scores"]["review_coverage"]
+    assert_equal 20, scored["summary"]["total_commits"]
+    assert_nil raw["developers"].first["dxi_score"]
+  end
+
   # ═══════════════════════════════════════════════════════════════════════════
   # Scopes
   # ═══════════════════════════════════════════════════════════════════════════
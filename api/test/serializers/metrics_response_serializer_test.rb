@@ -77,6 +77,14 @@ class MetricsResponseSerializerTest < ActiveSupport::TestCase
     assert_equal 80.0, json[:summary][:avg_dxi_score]
   end
 
+  test "reuses stored aggregates when every developer is visible" do
+    json = MetricsResponseSerializer.new(@sprint, visible_logins: %w[alice bob charlie]).as_json
+
+    assert_equal 22, json[:summary][:total_commits]
+    assert_equal 71.7, json[:team_dimension_scores][:review_speed]
+    assert_equal 3, json[:filter_meta][:showing_developers]
+  end
+
   # ═══════════════════════════════════════════════════════════════════════════
   # Team filtering
   # ═══════════════════════════════════════════════════════════════════════════
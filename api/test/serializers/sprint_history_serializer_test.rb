@@ -0,0 +1,77 @@
+# frozen_string_literal: true
+
+require "test_helper"
+
+class SprintHistorySerializerTest < ActiveSupport::TestCase
+  setup do
+    @sprints = [
+      Sprint.create!(
+        start_date: Date.new(2026, 3, 1),
+        end_date: Date.new(2026, 3, 14),
+        data: sprint_data(alice_commits: 10, bob_commits: 6)
+      ),
+      Sprint.create!(
+        start_date: Date.new(2026, 3, 15),
+        end_date: Date.new(2026, 3, 28),
+        data: sprint_data(alice_commits: 4, bob_commits: 2)
+      )
+    ]
+  end
+
+  test "collection serializes every sprint in order" do
+    entries = SprintHistorySerializer.collection(@sprints)
+
+    assert_equal %w[2026-03-01 2026-03-15], entries.map { |e| e[:start_date] }
+    assert_equal [ 16, 6 ], entries.map { |e| e[:total_commits] }
+  end
+
+  test "cached entries are relabelled once the current sprint ends" do
+    sprint = @sprints.last
+
+    Rails.stub(:cache, ActiveSupport::Cache::MemoryStore.new) do
+      travel_to(sprint.end_date) do
+        assert_equal "Current Sprint", SprintHistorySerializer.collection([ sprint ]).first[:sprint_label]
+      end
+      travel_to(sprint.end_date + 1) do
+        assert_equal Sprint.range_label(sprint.start_date, sprint.end_date),
+          SprintHistorySerializer.collection([ sprint ]).first[:sprint_label]
+      end
+    end
+  end
+
+  test "collection applies shared filters to every sprint" do
+    entries = SprintHistorySerializer.collection(@sprints, team_logins: %w[alice])
+
+    assert_equal [ 10, 4 ], entries.map { |e| e[:total_commits] }
+    assert_equal [ 1, 1 ], entries.map { |e| e[:developer_count] }
+  end
+
+  test "filters that keep every developer reuse the stored aggregates" do
+    sprint = @sprints.first
+    sprint.update!(data: sprint.data.merge("team_dimension_scores" => { "review_turnaround" => 90.0 }))
+
+    entry = SprintHistorySerializer.new(sprint, visible_logins: %w[alice bob]).as_json
+
+    assert_equal 90.0, entry[:dimension_scores][:review_speed]
+    assert_equal 16, entry[:total_commits]
+  end
+
+  private
+
+  def sprint_data(alice_commits:, bob_commits:)
+    {
+      "developers" => [
+        { "developer" => "alice", "commits" => alice_commits, "prs_opened" => 1, "dxi_score" => 80.0 },
+        { "developer" => "bob", "commits" => bob_commits, "prs_opened" => 1, "dxi_score" => 60.0 }
+      ],
+      "daily_activity" => [],
+      "summary" => {
+        "total_commits" => alice_commits + bob_commits,
+        "total_prs" => 2,
+        "developer_count" => 2,
+        "avg_dxi_score" => 70.0
+      },
+      "team_dimension_scores" => {}
+    }
+  end
+end
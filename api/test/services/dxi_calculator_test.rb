@@ -246,6 +246,21 @@ class DxiCalculatorTest < ActiveSupport::TestCase
     assert_equal 70.0, composite
   end
 
+  test "developer_scores returns stored dimension keys and matching composite" do
+    metrics = { "avg_review_time_hours" => 13, "avg_cycle_time_hours" => 4, "commits" => 10 }
+
+    scores, composite = DxiCalculator.developer_scores(metrics)
+
+    assert_equal %w[review_turnaround cycle_time pr_size review_coverage commit_frequency], scores.keys
+    assert_equal 50.0, scores["review_turnaround"]
+    assert_equal DxiCalculator.composite_score(DxiCalculator.dimension_scores(metrics)), composite
+  end
+
+  test "dimension_scores accepts symbol-keyed metrics" do
+    scores = DxiCalculator.dimension_scores({ avg_review_time_hours: 13 })
+    assert_equal 50.0, scores[:review_turnaround]
+  end
+
   # ═══════════════════════════════════════════════════════════════════════════
   # Team Dimension Scores Tests
   # ═══════════════════════════════════════════════════════════════════════════
@@ -274,4 +289,37 @@ class DxiCalculatorTest < ActiveSupport::TestCase
     assert_equal 50.0, team_scores[:review_coverage]
     assert_equal 50.0, team_scores[:commit_frequency]
   end
+
+  test "team_dimension_scores shares one frozen default for empty developers" do
+    assert_same DxiCalculator.team_dimension_scores([]), DxiCalculator.team_dimension_scores([])
+    assert_predicate DxiCalculator.team_dimension_scores([]), :frozen?
+  end
+
+  # ═══════════════════════════════════════════════════════════════════════════
+  # Team Summary Tests
+  # ═══════════════════════════════════════════════════════════════════════════
+
+  test "team_summary totals activity and averages dxi score" do
+    developers = [
+      { "commits" => 10, "prs_opened" => 3, "prs_merged" => 2, "reviews_given" => 4, "dxi_score" => 80.0 },
+      { "commits" => 5, "prs_opened" => nil, "prs_merged" => 1, "reviews_given" => 0, "dxi_score" => 65.5 }
+    ]
+
+    summary = DxiCalculator.team_summary(developers)
+
+    assert_equal 15, summary["total_commits"]
+    assert_equal 3, summary["total_prs"]
+    assert_equal 3, summary["total_merged"]
+    assert_equal 4, summary["total_reviews"]
+    assert_equal 2, summary["developer_count"]
+    assert_equal 72.8, summary["avg_dxi_score"]
+  end
+
+  test "team_summary returns zeros for empty developers" do
+    summary = DxiCalculator.team_summary([])
+
+    assert_equal 0, summary["total_commits"]
+    assert_equal 0, summary["developer_count"]
+    assert_equal 0.0, summary["avg_dxi_score"]
+  end
 end
@@ -171,4 +171,362 @@ class GithubServiceTest < ActiveSupport::TestCase
 
     assert_match(/GitHub API error \(500\)/, error.message)
   end
+
+  test "raises GitHubApiError for non-JSON error pages" do
+    stub_request(:post, "https://api.github.com/graphql")
+      .to_return(status: 502, body: "<html><body>Bad Gateway</body></html>", headers: { "Content-Type" => "text/html" })
+
+    error = assert_raises(GithubService::GitHubApiError) do
+      GithubService.fetch_sprint_data(Date.today - 14, Date.today)
+    end
+
+    assert_match(/GitHub API error \(502\)/, error.message)
+  end
+
+  test "fetches PRs and commits for several repos in one batched request each" do
+    today = Date.today
+    pushed_at = "#{today}T12:00:00Z"
+
+    stub_repositories(%w[api web], pushed_at)
+
+    prs_stub = stub_request(:post, "https://api.github.com/graphql")
+      .with { |req| req.body.include?("pullRequests(") }
+      .to_return(
+        status: 200,
+        body: {
+          data: {
+            r0: {
+              pullRequests: {
+                pageInfo: { hasNextPage: false, endCursor: nil },
+                nodes: [
+                  { number: 1, createdAt: pushed_at, mergedAt: nil, author: { login: "alice" },
+                    additions: 10, deletions: 2, reviews: { nodes: [] } }
+                ]
+              }
+            },
+            r1: {
+              pullRequests: {
+                pageInfo: { hasNextPage: false, endCursor: nil },
+                nodes: [
+                  { number: 2, createdAt: pushed_at, mergedAt: nil, author: { login: "bob" },
+                    additions: 5, deletions: 1, reviews: { nodes: [] } }
+                ]
+              }
+            }
+          }
+        }.to_json,
+        headers: { "Content-Type" => "application/json" }
+      )
+
+    commits_stub = stub_request(:post, "https://api.github.com/graphql")
+      .with { |req| req.body.include?("history(") }
+      .to_return(
+        status: 200,
+        body: {
+          data: {
+            r0: { defaultBranchRef: { target: { history: {
+              pageInfo: { hasNextPage: false, endCursor: nil },
+              nodes: [ { author: { user: { login: "alice" }, name: "Alice", date: pushed_at }, additions: 3, deletions: 0 } ]
+            } } } },
+            r1: { defaultBranchRef: nil }
+          }
+        }.to_json,
+        headers: { "Content-Type" => "application/json" }
+      )
+
+    result = GithubService.fetch_sprint_data(today - 1, today)
+
+    assert_requested prs_stub, times: 1
+    assert_requested commits_stub, times: 1
+    assert_equal %w[alice bob], result["developers"].map { |d| d["developer"] }.sort
+    assert_equal 2, result["summary"]["total_prs"]
+    assert_equal 1, result["summary"]["total_commits"]
+  end
+
+  test "fetches remaining reviews only for PRs with more than the inline page" do
+    today = Date.today
+    created_at = "#{today}T09:00:00Z"
+
+    stub_repositories(%w[api], created_at)
+
+    stub_request(:post, "https://api.github.com/graphql")
+      .with { |req| req.body.include?("pullRequests(") }
+      .to_return(
+        status: 200,
+        body: {
+          data: {
+            r0: {
+              pullRequests: {
+                pageInfo: { hasNextPage: false, endCursor: nil },
+                nodes: [
+                  { number: 7, createdAt: created_at, mergedAt: nil, author: { login: "alice" }, additions: 1, deletions: 1,
+                    reviews: {
+                      pageInfo: { hasNextPage: true, endCursor: "page-1" },
+                      nodes: [ { author: { login: "bob" }, submittedAt: "#{today}T10:00:00Z", state: "APPROVED" } ]
+                    } },
+                  { number: 8, createdAt: created_at, mergedAt: nil, author: { login: "alice" }, additions: 1, deletions: 1,
+                    reviews: { pageInfo: { hasNextPage: false, endCursor: nil }, nodes: [] } }
+                ]
+              }
+            }
+          }
+        }.to_json,
+        headers: { "Content-Type" => "application/json" }
+      )
+
+    stub_request(:post, "https://api.github.com/graphql")
+      .with { |req| req.body.include?("history(") }
+      .to_return(
+        status: 200,
+        body: { data: { r0: { defaultBranchRef: nil } } }.to_json,
+        headers: { "Content-Type" => "application/json" }
+      )
+
+    reviews_stub = stub_request(:post, "https://api.github.com/graphql")
+      .with { |req| req.body.include?("pullRequest(number: $number)") }
+      .to_return(
+        status: 200,
+        body: {
+          data: {
+            repository: {
+              pullRequest: {
+                reviews: {
+                  pageInfo: { hasNextPage: false, endCursor: nil },
+                  nodes: [ { author: { login: "carol" }, submittedAt: "#{today}T11:00:00Z", state: "COMMENTED" } ]
+                }
+              }
+            }
+          }
+        }.to_json,
+        headers: { "Content-Type" => "application/json" }
+      )
+
+    result = GithubService.fetch_sprint_data(today - 1, today)
+
+    assert_requested reviews_stub, times: 1
+    assert_requested(:post, "https://api.github.com/graphql", times: 1) do |req|
+      body = JSON.parse(req.body)
+      body["variables"]["number"] == 7 && body["variables"]["cursor"] == "page-1"
+    end
+    assert_equal 2, result["summary"]["total_reviews"]
+  end
+
+  test "caches the repository list and skips the cache on a forced fetch" do
+    today = Date.today
+    repos_stub = stub_repositories(%w[api], "#{today}T12:00:00Z")
+    stub_request(:post, "https://api.github.com/graphql")
+      .with { |req| req.body.include?("pullRequests(") }
+      .to_return(status: 200, body: { data: { r0: { pullRequests: { pageInfo: { hasNextPage: false, endCursor: nil }, nodes: [] } } } }.to_json,
+                 headers: { "Content-Type" => "application/json" })
+    stub_request(:post, "https://api.github.com/graphql")
+      .with { |req| req.body.include?("history(") }
+      .to_return(status: 200, body: { data: { r0: { defaultBranchRef: nil } } }.to_json,
+                 headers: { "Content-Type" => "application/json" })
+
+    Rails.stub(:cache, ActiveSupport::Cache::MemoryStore.new) do
+      GithubService.fetch_sprint_data(today - 1, today)
+      GithubService.fetch_sprint_data(today - 1, today)
+      assert_requested repos_stub, times: 1
+
+      GithubService.fetch_sprint_data(today - 1, today, force: true)
+      assert_requested repos_stub, times: 2
+
+      # The forced fetch wrote its list back for the next caller
+      GithubService.fetch_sprint_data(today - 1, today)
+      assert_requested repos_stub, times: 2
+    end
+  end
+
+  test "stops paging a repo's PRs once a page predates the sprint" do
+    today = Date.today
+    since = (today - 1).to_s
+
+    stub_repositories(%w[api], "#{today}T12:00:00Z")
+    stub_empty_commits
+
+    # Page 1 ends exactly on the window start, so paging continues; page 2
+    # ends before it, so page 3 is never requested.
+    prs_stub = stub_request(:post, "https://api.github.com/graphql")
+      .with { |req| req.body.include?("pullRequests(") }
+      .to_return(pr_page([ pr_node(1, "#{today}T12:00:00Z"), pr_node(2, "#{since}T00:00:00Z") ], cursor: "c1"))
+      .then.to_return(pr_page([ pr_node(3, "#{today - 2}T23:59:59Z") ], cursor: "c2"))
+      .then.to_return(pr_page([ pr_node(4, "#{today - 3}T12:00:00Z") ]))
+
+    result = GithubService.fetch_sprint_data(today - 1, today)
+
+    assert_requested prs_stub, times: 2
+    assert_requested(:post, "https://api.github.com/graphql", times: 1) do |req|
+      body = JSON.parse(req.body)
+      req.body.include?("pullRequests(") && body["variables"]["cursor0"] == "c1"
+    end
+    assert_equal 2, result["summary"]["total_prs"]
+  end
+
+  test "stops paging repositories once a page predates the sprint" do
+    today = Date.today
+    since = (today - 1).to_s
+
+    repos_stub = stub_request(:post, "https://api.github.com/graphql")
+      .with { |req| req.body.include?("organization(login: $org)") }
+      .to_return(repo_page([ repo_node("api", "#{today}T12:00:00Z"), repo_node("fork", "#{since}T00:00:00Z", fork: true) ], cursor: "c1"))
+      .then.to_return(repo_page([ repo_node("archived", "#{since}T00:00:00Z", archived: true), repo_node("stale", "#{today - 2}T23:59:59Z") ], cursor: "c2"))
+      .then.to_return(repo_page([ repo_node("older", "#{today - 3}T12:00:00Z") ]))
+    prs_stub = stub_request(:post, "https://api.github.com/graphql")
+      .with { |req| req.body.include?("pullRequests(") }
+      .to_return(pr_page([]))
+    stub_empty_commits
+
+    GithubService.fetch_sprint_data(today - 1, today)
+
+    # Page 1 ends exactly on the window start, so paging continues to page 2,
+    # which ends before it
+    assert_requested repos_stub, times: 2
+    # Archived, forked and stale repos are dropped before the PR batch
+    assert_requested prs_stub, times: 1
+    assert_requested(:post, "https://api.github.com/graphql", times: 1) do |req|
+      variables = JSON.parse(req.body)["variables"]
+      req.body.include?("pullRequests(") && variables["name0"] == "api" && !variables.key?("name1")
+    end
+  end
+
+  test "counts activity from the first instant of the sprint up to, not including, the day after it" do
+    today = Date.today
+    since = (today - 1).to_s
+    window_end = (today + 1).to_s
+
+    stub_repositories(%w[api], "#{today}T12:00:00Z")
+    stub_request(:post, "https://api.github.com/graphql")
+      .with { |req| req.body.include?("pullRequests(") }
+      .to_return(pr_page([
+        pr_node(1, "#{window_end}T00:00:00Z"),
+        pr_node(2, "#{today}T23:59:59Z", merged_at: "#{today}T23:59:59Z"),
+        pr_node(3, "#{since}T00:00:00Z", merged_at: "#{window_end}T00:00:00Z"),
+        pr_node(4, "#{today - 2}T23:59:59Z")
+      ]))
+    stub_request(:post, "https://api.github.com/graphql")
+      .with { |req| req.body.include?("history(") }
+      .to_return(
+        status: 200,
+        body: {
+          data: {
+            r0: { defaultBranchRef: { target: { history: {
+              pageInfo: { hasNextPage: false, endCursor: nil },
+              nodes: [
+                { author: { user: { login: "alice" }, name: "Alice", date: "#{window_end}T00:00:00Z" }, additions: 1, deletions: 0 },
+                { author: { user: { login: "alice" }, name: "Alice", date: "#{since}T00:00:00Z" }, additions: 1, deletions: 0 }
+              ]
+            } } } }
+          }
+        }.to_json,
+        headers: { "Content-Type" => "application/json" }
+      )
+
+    result = GithubService.fetch_sprint_data(today - 1, today)
+
+    assert_equal 2, result["summary"]["total_prs"]
+    assert_equal 1, result["summary"]["total_merged"]
+    assert_equal 1, result["summary"]["total_commits"]
+  end
+
+  test "map_concurrently returns results in input order" do
+    results = GithubService.send(:map_concurrently, (1..6).to_a) do |n|
+      sleep((6 - n) * 0.01) # later items finish first
+      n * 10
+    end
+
+    assert_equal [ 10, 20, 30, 40, 50, 60 ], results
+  end
+
+  test "map_concurrently re-raises the first error after every worker has finished" do
+    running = 0
+    lock = Mutex.new
+
+    error = assert_raises(GithubService::GitHubApiError) do
+      GithubService.send(:map_concurrently, (1..6).to_a) do |n|
+        lock.synchronize { running += 1 }
+        begin
+          sleep 0.02
+          raise GithubService::GitHubApiError, "failed #{n}" if n == 2
+          n
+        ensure
+          lock.synchronize { running -= 1 }
+        end
+      end
+    end
+
+    assert_equal "failed 2", error.message
+    assert_equal 0, running
+  end
+
+  test "map_concurrently runs zero or one item on the calling thread" do
+    threads = []
+
+    assert_equal [], GithubService.send(:map_concurrently, []) { |n| n }
+    assert_equal [ 2 ], GithubService.send(:map_concurrently, [ 1 ]) { |n| threads << Thread.current; n * 2 }
+    assert_equal [ Thread.current ], threads
+  end
+
+  private
+
+  def repo_node(name, pushed_at, archived: false, fork: false)
+    { name: name, isArchived: archived, isFork: fork, pushedAt: pushed_at }
+  end
+
+  def repo_page(nodes, cursor: nil)
+    {
+      status: 200,
+      body: {
+        data: { organization: { repositories: { pageInfo: { hasNextPage: !cursor.nil?, endCursor: cursor }, nodes: nodes } } }
+      }.to_json,
+      headers: { "Content-Type" => "application/json" }
+    }
+  end
+
+  def pr_node(number, created_at, login: "alice", merged_at: nil)
+    { number: number, createdAt: created_at, mergedAt: merged_at, author: { login: login },
+      additions: 1, deletions: 1, reviews: { nodes: [] } }
+  end
+
+  # One page of a single-repo (r0) pullRequests batch response
+  def pr_page(nodes, cursor: nil)
+    {
+      status: 200,
+      body: {
+        data: {
+          rateLimit: { cost: 1, remaining: 4999 },
+          r0: { pullRequests: { pageInfo: { hasNextPage: !cursor.nil?, endCursor: cursor }, nodes: nodes } }
+        }
+      }.to_json,
+      headers: { "Content-Type" => "application/json" }
+    }
+  end
+
+  def stub_empty_commits
+    stub_request(:post, "https://api.github.com/graphql")
+      .with { |req| req.body.include?("history(") }
+      .to_return(
+        status: 200,
+        body: { data: { r0: { defaultBranchRef: nil } } }.to_json,
+        headers: { "Content-Type" => "application/json" }
+      )
+  end
+
+  def stub_repositories(names, pushed_at)
+    stub_request(:post, "https://api.github.com/graphql")
+      .with { |req| req.body.include?("organization(login: $org)") }
+      .to_return(
+        status: 200,
+        body: {
+          data: {
+            organization: {
+              repositories: {
+                pageInfo: { hasNextPage: false, endCursor: nil },
+                nodes: names.map { |name| { name: name, isArchived: false, isFork: false, pushedAt: pushed_at } }
+              }
+            }
+          }
+        }.to_json,
+        headers: { "Content-Type" => "application/json" }
+      )
+  end
 end
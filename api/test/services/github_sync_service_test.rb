@@ -75,6 +75,21 @@ class GithubSyncServiceTest < ActiveSupport::TestCase
     end
   end
 
+  test "sync_org_members updates known and creates new members in one pass" do
+    alice = developers(:alice_dev)
+    @stub_github.org_members = [
+      { "id" => alice.github_id, "login" => "alice", "avatar_url" => "https://new-avatar.png" },
+      { "id" => 300003, "login" => "newdev3", "avatar_url" => "https://github.com/newdev3.png" }
+    ]
+
+    assert_difference "Developer.count", 1 do
+      assert_equal 2, @service.sync_org_members
+    end
+
+    assert_equal "https://new-avatar.png", alice.reload.avatar_url
+    assert_equal 1, Developer.where(github_login: "alice").count
+  end
+
   # ═══════════════════════════════════════════════════════════════════════════
   # sync_teams
   # ═══════════════════════════════════════════════════════════════════════════
@@ -120,6 +135,26 @@ class GithubSyncServiceTest < ActiveSupport::TestCase
     assert backend.synced?
   end
 
+  test "sync_teams only adds and removes the memberships that changed" do
+    backend = teams(:backend)
+    kept = team_memberships(:alice_backend)
+    @stub_github.org_teams = [
+      { "id" => backend.github_team_id, "name" => "Backend", "slug" => "backend" }
+    ]
+    @stub_github.team_members_map = {
+      "backend" => [
+        { "id" => developers(:alice_dev).github_id, "login" => "alice" },
+        { "id" => developers(:charlie_dev).github_id, "login" => "charlie" }
+      ]
+    }
+
+    @service.sync_teams
+
+    assert_equal %w[alice charlie], backend.reload.developers.pluck(:github_login).sort
+    # alice's membership is left in place rather than recreated
+    assert TeamMembership.exists?(kept.id)
+  end
+
   test "sync_teams skips membership update for diverged teams" do
     diverged = teams(:diverged_team)
     assert_not diverged.synced?
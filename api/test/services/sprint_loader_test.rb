@@ -28,7 +28,7 @@ class SprintLoaderTest < ActiveSupport::TestCase
       @fetch_count = 0
     end
 
-    def fetch_sprint_data(_start_date, _end_date)
+    def fetch_sprint_data(_start_date, _end_date, force: false)
       @fetch_count += 1
       @data
     end
@@ -43,7 +43,7 @@ class SprintLoaderTest < ActiveSupport::TestCase
       @fetch_count = 0
     end
 
-    def fetch_sprint_data(_start_date, _end_date)
+    def fetch_sprint_data(_start_date, _end_date, force: false)
       @fetch_count += 1
       sleep(@delay)
       @data
@@ -129,6 +129,22 @@ class SprintLoaderTest < ActiveSupport::TestCase
     assert_equal 1, fetcher.fetch_count
   end
 
+  test "refetching identical data after the settle period settles the sprint" do
+    fetcher = MockFetcher.new(@mock_data)
+    loader = SprintLoader.new(fetcher: fetcher)
+    first_fetch = @end_date.end_of_day + 1.day
+
+    travel_to(first_fetch) { loader.load(@start_date, @end_date) }
+    sprint = travel_to(@end_date.end_of_day + Sprint::SETTLE_PERIOD + 1.hour) do
+      loader.load(@start_date, @end_date, force: true)
+    end
+    sprint.reload
+
+    assert_equal 2, fetcher.fetch_count
+    assert sprint.settled?
+    assert_equal first_fetch.to_i, sprint.updated_at.to_i
+  end
+
   # ═══════════════════════════════════════════════════════════════════════════
   # Race Condition Tests
   # ═══════════════════════════════════════════════════════════════════════════
@@ -137,7 +153,7 @@ class SprintLoaderTest < ActiveSupport::TestCase
     # Simulate race condition by creating sprint after first check but before insert
     call_count = 0
     fetcher = Object.new
-    fetcher.define_singleton_method(:fetch_sprint_data) do |_s, _e|
+    fetcher.define_singleton_method(:fetch_sprint_data) do |_s, _e, force: false|
       call_count += 1
       # Simulate another request creating the sprint during fetch
       Sprint.find_or_create_by!(
@@ -156,6 +172,46 @@ class SprintLoaderTest < ActiveSupport::TestCase
     assert_equal 1, Sprint.where(start_date: @start_date, end_date: @end_date).count
   end
 
+  test "concurrent loads of the same sprint fetch once" do
+    fetcher = SlowMockFetcher.new(@mock_data)
+
+    sprints = Array.new(3) do
+      Thread.new { SprintLoader.new(fetcher: fetcher).load(@start_date, @end_date) }
+    end.map(&:value)
+
+    assert_equal 1, fetcher.fetch_count
+    assert_equal 1, sprints.map(&:id).uniq.size
+  end
+
+  test "force load after waiting on another fetch reuses its result" do
+    Sprint.create!(start_date: @start_date, end_date: @end_date, data: { "old" => "data" })
+    fetcher = SlowMockFetcher.new(@mock_data)
+
+    sprints = Array.new(2) do
+      Thread.new { SprintLoader.new(fetcher: fetcher).load(@start_date, @end_date, force: true) }
+    end.map(&:value)
+
+    assert_equal 1, fetcher.fetch_count
+    assert(sprints.all? { |sprint| sprint.data == @mock_data })
+  end
+
+  test "force load after waiting on a fetch of unchanged data reuses it" do
+    Sprint.create!(start_date: @start_date, end_date: @end_date, data: @mock_data, fetched_at: 1.hour.ago)
+    fetcher = SlowMockFetcher.new(@mock_data)
+
+    Array.new(2) do
+      Thread.new { SprintLoader.new(fetcher: fetcher).load(@start_date, @end_date, force: true) }
+    end.each(&:join)
+
+    assert_equal 1, fetcher.fetch_count
+  end
+
+  test "fetch locks are released once no load holds them" do
+    SprintLoader.new(fetcher: MockFetcher.new(@mock_data)).load(@start_date, @end_date)
+
+    assert_empty SprintLoader.const_get(:FETCH_LOCKS)
+  end
+
   # ═══════════════════════════════════════════════════════════════════════════
   # Transaction Scope Tests (Critical for SQLite)
   # ═══════════════════════════════════════════════════════════════════════════
@@ -171,7 +227,7 @@ class SprintLoaderTest < ActiveSupport::TestCase
     transactions_during_fetch = nil
 
     fetcher = Object.new
-    fetcher.define_singleton_method(:fetch_sprint_data) do |_s, _e|
+    fetcher.define_singleton_method(:fetch_sprint_data) do |_s, _e, force: false|
       # Capture transaction count during fetch
       transactions_during_fetch = Sprint.connection.open_transactions
       { "team_metrics" => {} }
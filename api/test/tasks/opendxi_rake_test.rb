@@ -0,0 +1,89 @@
+# frozen_string_literal: true
+
+require "test_helper"
+require "rake"
+require "sqlite3"
+require "tmpdir"
+
+class OpendxiRakeTest < ActiveSupport::TestCase
+  include ActiveJob::TestHelper
+
+  setup do
+    Rails.application.load_tasks unless Rake::Task.task_defined?("opendxi:stats")
+  end
+
+  test "migrate_legacy reads the first legacy table name that exists" do
+    with_legacy_db do |db|
+      db.execute("CREATE TABLE sprint_data (sprint_start TEXT, sprint_end TEXT, data TEXT)")
+      db.execute("INSERT INTO sprint_data VALUES ('2025-06-01', '2025-06-14', '{}')")
+      db.execute("CREATE TABLE sprint_cache (sprint_key TEXT, data_json TEXT)")
+      db.execute("INSERT INTO sprint_cache VALUES ('sprint_2025-07-01_2025-07-14', '{}')")
+
+      out, _err = capture_io { Rake::Task["opendxi:migrate_legacy"].execute }
+
+      assert_includes out, "Found table: sprint_cache"
+      assert Sprint.find_by_dates(Date.new(2025, 7, 1), Date.new(2025, 7, 14))
+      assert_nil Sprint.find_by_dates(Date.new(2025, 6, 1), Date.new(2025, 6, 14))
+    end
+  end
+
+  test "migrate_legacy exits when no legacy table exists" do
+    with_legacy_db do |db|
+      db.execute("CREATE TABLE unrelated (id INTEGER)")
+
+      out, _err = capture_io do
+        assert_raises(SystemExit) { Rake::Task["opendxi:migrate_legacy"].execute }
+      end
+
+      assert_includes out, "No sprint data table found"
+    end
+  end
+
+  test "enqueue_refresh enqueues the GitHub refresh job" do
+    assert_enqueued_with(job: RefreshGithubDataJob) do
+      capture_io { Rake::Task["opendxi:enqueue_refresh"].execute }
+    end
+  end
+
+  test "stats aggregates counts, date range and DXI in SQL" do
+    Sprint.create!(start_date: Date.new(2026, 1, 1), end_date: Date.new(2026, 1, 14),
+                   data: { "developers" => [ { "developer" => "alice" }, { "developer" => "bob" } ], "summary" => { "avg_dxi_score" => 80.0 } })
+    Sprint.create!(start_date: Date.new(2026, 1, 15), end_date: Date.new(2026, 1, 28),
+                   data: { "developers" => [ { "developer" => "alice" } ], "summary" => { "avg_dxi_score" => 70.5 } })
+    # No developers or summary: counts as a sprint but adds nothing else
+    Sprint.create!(start_date: Date.new(2026, 1, 29), end_date: Date.new(2026, 2, 11), data: {})
+
+    out, _err = capture_io { Rake::Task["opendxi:stats"].execute }
+
+    assert_includes out, "Total sprints: 3"
+    assert_includes out, "Date range: 2026-01-01 to 2026-02-11"
+    assert_includes out, "Total developer entries: 3"
+    assert_includes out, "Average team DXI: 50.2"
+  end
+
+  test "stats prints only the total when there are no sprints" do
+    Sprint.delete_all
+
+    out, _err = capture_io { Rake::Task["opendxi:stats"].execute }
+
+    assert_includes out, "Total sprints: 0"
+    assert_not_includes out, "Date range"
+  end
+
+  private
+
+  def with_legacy_db
+    Dir.mktmpdir do |dir|
+      path = File.join(dir, "legacy.db")
+      db = SQLite3::Database.new(path)
+      original = ENV["LEGACY_DB_PATH"]
+      ENV["LEGACY_DB_PATH"] = path
+      begin
+        yield db
+      ensure
+        db.close
+        ENV["LEGACY_DB_PATH"] = original
+      end
+    end
+  end
+end
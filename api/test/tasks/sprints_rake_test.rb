@@ -0,0 +1,75 @@
+# frozen_string_literal: true
+
+require "test_helper"
+require "rake"
+
+class SprintsRakeTest < ActiveSupport::TestCase
+  setup do
+    Rails.application.load_tasks unless Rake::Task.task_defined?("sprints:refresh_empty")
+  end
+
+  test "refresh_empty only picks sprints without daily activity" do
+    empty = Sprint.create!(start_date: Date.new(2026, 1, 1), end_date: Date.new(2026, 1, 14), data: { "daily_activity" => [] })
+    no_data = Sprint.create!(start_date: Date.new(2026, 1, 15), end_date: Date.new(2026, 1, 28), data: {})
+    Sprint.create!(start_date: Date.new(2026, 1, 29), end_date: Date.new(2026, 2, 11), data: { "daily_activity" => [ activity("2026-01-29") ] })
+    fetched = Queue.new
+
+    fetch = lambda do |start_date, _end_date, force: false|
+      fetched << start_date
+      { "daily_activity" => [ activity(start_date) ] }
+    end
+    GithubService.stub(:fetch_sprint_data, fetch) do
+      capture_io { Rake::Task["sprints:refresh_empty"].execute }
+    end
+
+    assert_equal [ empty.start_date.to_s, no_data.start_date.to_s ], Array.new(fetched.size) { fetched.pop }.sort
+    assert_equal 1, empty.reload.daily_activity.size
+    assert_equal 1, no_data.reload.daily_activity.size
+  end
+
+  test "refresh_empty saves the other sprints when one write fails" do
+    good = Sprint.create!(start_date: Date.new(2026, 1, 1), end_date: Date.new(2026, 1, 14), data: {})
+    bad = Sprint.create!(start_date: Date.new(2026, 1, 15), end_date: Date.new(2026, 1, 28), data: {})
+
+    fetch = lambda do |start_date, _end_date, force: false|
+      # Fails Sprint's data validation, so this sprint's write raises
+      next { "daily_activity" => "not a list" } if start_date == bad.start_date.to_s
+
+      { "daily_activity" => [ activity(start_date) ] }
+    end
+    out, _err = GithubService.stub(:fetch_sprint_data, fetch) do
+      capture_io { Rake::Task["sprints:refresh_empty"].execute }
+    end
+
+    assert_match(/Failed to save #{bad.start_date}/, out)
+    assert_equal 1, good.reload.daily_activity.size
+    assert_equal({}, bad.reload.data)
+    assert_nil bad.fetched_at
+  end
+
+  test "refresh_all saves the other sprints when one write fails" do
+    current_start, current_end = Sprint.current_sprint_dates
+
+    fetch = lambda do |start_date, _end_date, force: false|
+      next { "daily_activity" => "not a list" } if start_date == current_start.to_s
+
+      { "daily_activity" => [ activity(start_date) ] }
+    end
+    out, _err = GithubService.stub(:fetch_sprint_data, fetch) do
+      capture_io do
+        assert_difference "Sprint.count", 5 do
+          Rake::Task["sprints:refresh_all"].execute
+        end
+      end
+    end
+
+    assert_match(/Failed to save #{current_start}/, out)
+    assert_nil Sprint.find_by_dates(current_start, current_end)
+  end
+
+  private
+
+  def activity(date)
+    { "date" => date.to_s, "commits" => 1, "prs_opened" => 0, "prs_merged" => 0, "reviews_given" => 0 }
+  end
+end